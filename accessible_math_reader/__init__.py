@@ -32,15 +32,21 @@ reader.to_audio(r"\\frac{a}{b}", output_path="output.mp3")
 @copyright MIT License
 """
 
-from accessible_math_reader.core.parser import MathParser
-from accessible_math_reader.core.semantic import SemanticNode, NodeType
-from accessible_math_reader.core.renderer import MathRenderer
-from accessible_math_reader.speech.engine import SpeechEngine
-from accessible_math_reader.speech.rules import SpeechRuleSet, VerbosityLevel
-from accessible_math_reader.braille.nemeth import NemethConverter
-from accessible_math_reader.braille.ueb import UEBConverter
-from accessible_math_reader.config import Config
-from accessible_math_reader.reader import MathReader
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from accessible_math_reader.core.parser import MathParser
+    from accessible_math_reader.core.semantic import SemanticNode, NodeType
+    from accessible_math_reader.core.renderer import MathRenderer
+    from accessible_math_reader.speech.engine import SpeechEngine
+    from accessible_math_reader.speech.rules import SpeechRuleSet, VerbosityLevel
+    from accessible_math_reader.braille.nemeth import NemethConverter
+    from accessible_math_reader.braille.ueb import UEBConverter
+    from accessible_math_reader.config import Config
+    from accessible_math_reader.reader import MathReader
 
 __version__ = "0.1.0"
 __all__ = [
@@ -61,3 +67,34 @@ __all__ = [
     # Configuration
     "Config",
 ]
+
+# Public names resolved on first access (PEP 562), so light entry points
+# such as `amr --version` do not import the parser and renderer stack
+_LAZY_EXPORTS = {
+    "MathReader": "accessible_math_reader.reader",
+    "MathParser": "accessible_math_reader.core.parser",
+    "SemanticNode": "accessible_math_reader.core.semantic",
+    "NodeType": "accessible_math_reader.core.semantic",
+    "MathRenderer": "accessible_math_reader.core.renderer",
+    "SpeechEngine": "accessible_math_reader.speech.engine",
+    "SpeechRuleSet": "accessible_math_reader.speech.rules",
+    "VerbosityLevel": "accessible_math_reader.speech.rules",
+    "NemethConverter": "accessible_math_reader.braille.nemeth",
+    "UEBConverter": "accessible_math_reader.braille.ueb",
+    "Config": "accessible_math_reader.config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its defining module on first access."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List lazily exported names alongside the loaded module globals."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -0,0 +1,17 @@
+"""!
+@file _compat.py
+@brief Python version shims shared across the package.
+
+@author Accessible Math Reader Contributors
+@version 0.1.0
+"""
+
+from __future__ import annotations
+
+import sys
+
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__, making
+# instances smaller and their attribute reads faster. Spread into the
+# decorator as @dataclass(**_DATACLASS_SLOTS)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -0,0 +1,26 @@
+"""!
+@file braille/_tables.py
+@brief Braille cell tables shared by the Nemeth and UEB converters.
+
+@details
+Both codes use the literary Braille alphabet for lowercase Latin letters,
+so a single frozen table serves both converters.
+
+@author Accessible Math Reader Contributors
+@version 0.1.0
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+
+
+# Lowercase Latin letters (standard literary Braille)
+LETTERS = MappingProxyType({
+    "a": "⠁", "b": "⠃", "c": "⠉", "d": "⠙", "e": "⠑",
+    "f": "⠋", "g": "⠛", "h": "⠓", "i": "⠊", "j": "⠚",
+    "k": "⠅", "l": "⠇", "m": "⠍", "n": "⠝", "o": "⠕",
+    "p": "⠏", "q": "⠟", "r": "⠗", "s": "⠎", "t": "⠞",
+    "u": "⠥", "v": "⠧", "w": "⠺", "x": "⠭", "y": "⠽",
+    "z": "⠵",
+})
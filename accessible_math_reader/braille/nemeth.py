@@ -18,10 +18,14 @@ proper handling of:
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
+from accessible_math_reader.braille._tables import LETTERS as _SHARED_LETTERS
 from accessible_math_reader.core.semantic import SemanticNode, NodeType
-from accessible_math_reader.core.renderer import BaseRenderer
+from accessible_math_reader.core.renderer import (
+    BaseRenderer, ALL_CHILDREN, compile_layouts, render_layout,
+)
 
 if TYPE_CHECKING:
     from accessible_math_reader.config import Config
@@ -65,7 +69,7 @@ class NemethConverter(BaseRenderer):
     
     # Digits in Nemeth use the same cells as letters a-j but are preceded
     # by the numeric indicator when starting a number
-    DIGITS = {
+    DIGITS = MappingProxyType({
         "0": "⠴",  # Dots 356
         "1": "⠂",  # Dot 2
         "2": "⠆",  # Dots 23
@@ -76,20 +80,13 @@ class NemethConverter(BaseRenderer):
         "7": "⠶",  # Dots 2356
         "8": "⠦",  # Dots 236
         "9": "⠔",  # Dots 35
-    }
+    })
     
     # Lowercase letters (same as standard Braille)
-    LETTERS = {
-        "a": "⠁", "b": "⠃", "c": "⠉", "d": "⠙", "e": "⠑",
-        "f": "⠋", "g": "⠛", "h": "⠓", "i": "⠊", "j": "⠚",
-        "k": "⠅", "l": "⠇", "m": "⠍", "n": "⠝", "o": "⠕",
-        "p": "⠏", "q": "⠟", "r": "⠗", "s": "⠎", "t": "⠞",
-        "u": "⠥", "v": "⠧", "w": "⠺", "x": "⠭", "y": "⠽",
-        "z": "⠵",
-    }
+    LETTERS = _SHARED_LETTERS
     
     # Greek letters using Nemeth Greek letter indicator (⠨)
-    GREEK = {
+    GREEK = MappingProxyType({
         "α": "⠨⠁", "β": "⠨⠃", "γ": "⠨⠛", "δ": "⠨⠙",
         "ε": "⠨⠑", "ζ": "⠨⠵", "η": "⠨⠱", "θ": "⠨⠹",
         "ι": "⠨⠊", "κ": "⠨⠅", "λ": "⠨⠇", "μ": "⠨⠍",
@@ -100,10 +97,10 @@ class NemethConverter(BaseRenderer):
         "Α": "⠠⠨⠁", "Β": "⠠⠨⠃", "Γ": "⠠⠨⠛", "Δ": "⠠⠨⠙",
         "Θ": "⠠⠨⠹", "Λ": "⠠⠨⠇", "Π": "⠠⠨⠏", "Σ": "⠠⠨⠎",
         "Φ": "⠠⠨⠋", "Ψ": "⠠⠨⠽", "Ω": "⠠⠨⠺",
-    }
+    })
     
     # Mathematical operators
-    OPERATORS = {
+    OPERATORS = MappingProxyType({
         "+": "⠬",    # Plus (dots 346)
         "-": "⠤",    # Minus (dots 36)
         "−": "⠤",    # Minus sign variant
@@ -115,10 +112,10 @@ class NemethConverter(BaseRenderer):
         ")": "⠾",    # Right paren (dots 23456)
         "[": "⠈⠷",  # Left bracket
         "]": "⠈⠾",  # Right bracket
-    }
+    })
     
     # Relations
-    RELATIONS = {
+    RELATIONS = MappingProxyType({
         "=": "⠀⠿⠀",  # Equals with spaces (dots 123456)
         "<": "⠀⠪⠀",  # Less than (dots 126)
         ">": "⠀⠻⠀",  # Greater than (dots 12456)
@@ -126,7 +123,7 @@ class NemethConverter(BaseRenderer):
         "≥": "⠀⠻⠿⠀",  # Greater than or equal
         "≠": "⠀⠿⠈⠱⠀",  # Not equal
         "≈": "⠀⠈⠿⠀",  # Approximately equal
-    }
+    })
     
     # Structural indicators
     NUMERIC_INDICATOR = "⠼"      # Dots 3456 - precedes numbers
@@ -157,6 +154,42 @@ class NemethConverter(BaseRenderer):
     ELEMENT_OF = "⠈⠑"           # Element of set
     NOT_ELEMENT = "⠈⠑⠌"        # Not an element of
     
+    # Composite node layouts for render_layout(): indicator strings,
+    # child indices (skipped when the child is missing) and ALL_CHILDREN
+    _LAYOUTS = compile_layouts({
+        NodeType.ROOT: (ALL_CHILDREN,),
+        NodeType.GROUP: (ALL_CHILDREN,),
+        # ⠹ numerator ⠌ denominator ⠼
+        NodeType.FRACTION: (FRACTION_OPEN, 0, FRACTION_LINE, 1, FRACTION_CLOSE),
+        # base ⠘ exponent (baseline indicator would be added contextually)
+        NodeType.SUPERSCRIPT: (0, SUPERSCRIPT_IND, 1),
+        # base ⠰ subscript
+        NodeType.SUBSCRIPT: (0, SUBSCRIPT_IND, 1),
+        # ⠜ radicand ⠻
+        NodeType.SQRT: (SQRT_OPEN, 0, SQRT_CLOSE),
+        # index ⠜ radicand ⠻
+        NodeType.NROOT: (0, SQRT_OPEN, 1, SQRT_CLOSE),
+        NodeType.SUM: ("⠠⠨⠎", ALL_CHILDREN),
+        NodeType.INTEGRAL: ("⠮", ALL_CHILDREN),
+    })
+    
+    # Translation tables for character-by-character substitution,
+    # built once at class creation and applied with str.translate
+    _LETTERS_TRANS = str.maketrans(dict(LETTERS))
+    _NUMBER_TRANS = str.maketrans({**DIGITS, ".": "⠨"})           # ⠨ = decimal point
+    _TEXT_TRANS = str.maketrans({**LETTERS, **DIGITS, " ": "⠀"})  # ⠀ = Braille space
+    
+    # Pre-joined cells for single-symbol identifiers: Greek letters,
+    # infinity and Latin letters, with capitals already carrying ⠠
+    _IDENTIFIER_CELLS = {
+        **GREEK,
+        "∞": "⠠⠿",  # Nemeth infinity symbol
+        **LETTERS,
+        **{letter.upper(): "⠠" + cell for letter, cell in LETTERS.items()},
+    }
+    
+    __slots__ = ("_dispatch",)
+    
     def __init__(self, config: Config | None = None) -> None:
         """!
         @brief Initialize Nemeth converter.
@@ -165,37 +198,24 @@ class NemethConverter(BaseRenderer):
         """
         super().__init__(config)
         
-        # === MODE STATE MACHINE ===
-        # Track current mode for proper indicator insertion
-        # Modes: NEUTRAL, NUMERIC, LETTER, MATH
-        self._current_mode = 'NEUTRAL'
-        
-        # Track if we need baseline indicator after scripts
-        self._needs_baseline = False
-        
-        # === PHASE 3: ERROR HANDLING ===
-        # Track unsupported constructs for graceful fallback
-        self._unsupported_nodes: list[str] = []
+        # Leaf render methods by node type, resolved once instead of per node
+        self._dispatch = {
+            node_type: method
+            for node_type in NodeType
+            if (method := getattr(self, f"_render_{node_type.name.lower()}", None))
+        }
     
     def render(self, node: SemanticNode) -> str:
         """!
         @brief Render semantic node to Nemeth Braille.
         
+        @details
+        The tree is walked iteratively with render_layout().
+        
         @param node Semantic node to render
         @return Nemeth Braille string
         """
-        method = getattr(self, f"_render_{node.node_type.name.lower()}", None)
-        if method:
-            return method(node)
-        return self._render_default(node)
-    
-    def _render_root(self, node: SemanticNode) -> str:
-        """Render root node."""
-        return "".join(self.render(c) for c in node.children)
-    
-    def _render_group(self, node: SemanticNode) -> str:
-        """Render group node."""
-        return "".join(self.render(c) for c in node.children)
+        return render_layout(node, self._LAYOUTS, self._dispatch, self._render_default)
     
     def _render_number(self, node: SemanticNode) -> str:
         """!
@@ -208,18 +228,7 @@ class NemethConverter(BaseRenderer):
         @param node Number node
         @return Nemeth Braille for the number
         """
-        content = node.content
-        result = self.NUMERIC_INDICATOR
-        
-        for char in content:
-            if char in self.DIGITS:
-                result += self.DIGITS[char]
-            elif char == ".":
-                result += "⠨"  # Decimal point
-            else:
-                result += char
-        
-        return result
+        return self.NUMERIC_INDICATOR + node.content.translate(self._NUMBER_TRANS)
     
     def _render_identifier(self, node: SemanticNode) -> str:
         """!
@@ -230,29 +239,20 @@ class NemethConverter(BaseRenderer):
         """
         content = node.content
         
-        # Check Greek letters first
-        if content in self.GREEK:
-            return self.GREEK[content]
+        # Greek letters, infinity and single Latin letters
+        cells = self._IDENTIFIER_CELLS.get(content)
+        if cells is not None:
+            return cells
         
-        # Infinity
-        if content == "∞":
-            return "⠠⠿"  # Nemeth infinity symbol
-        
-        # Single letter - may need letter indicator in some contexts
-        if len(content) == 1 and content.lower() in self.LETTERS:
-            letter = self.LETTERS[content.lower()]
+        # Other single letters that lower-case to a Latin letter
+        letter = self.LETTERS.get(content.lower()) if len(content) == 1 else None
+        if letter is not None:
             if content.isupper():
                 return "⠠" + letter  # Capital indicator
             return letter
         
         # Multi-letter identifier
-        result = ""
-        for char in content.lower():
-            if char in self.LETTERS:
-                result += self.LETTERS[char]
-            else:
-                result += char
-        return result
+        return content.lower().translate(self._LETTERS_TRANS)
     
     def _render_operator(self, node: SemanticNode) -> str:
         """!
@@ -272,155 +272,21 @@ class NemethConverter(BaseRenderer):
         """
         return self.RELATIONS.get(node.content, node.content)
     
-    def _render_fraction(self, node: SemanticNode) -> str:
-        """!
-        @brief Render fraction in Nemeth format.
-        
-        @details
-        Nemeth fractions use:
-        - ⠹ (fraction open)
-        - numerator
-        - ⠌ (fraction line)
-        - denominator  
-        - ⠼ (fraction close)
-        
-        @param node Fraction node with numerator and denominator children
-        @return Nemeth fraction
-        """
-        result = self.FRACTION_OPEN
-        
-        # Numerator
-        if node.children:
-            result += self.render(node.children[0])
-        
-        result += self.FRACTION_LINE
-        
-        # Denominator
-        if len(node.children) > 1:
-            result += self.render(node.children[1])
-        
-        result += self.FRACTION_CLOSE
-        return result
-    
-    def _render_superscript(self, node: SemanticNode) -> str:
-        """!
-        @brief Render superscript/exponent.
-        
-        @details
-        Uses superscript indicator ⠘ before the exponent.
-        Returns to baseline with ⠐ if followed by more content.
-        
-        @param node Superscript node
-        @return Nemeth superscript
-        """
-        result = ""
-        
-        # Base
-        if node.children:
-            result += self.render(node.children[0])
-        
-        # Superscript indicator + exponent
-        result += self.SUPERSCRIPT_IND
-        
-        if len(node.children) > 1:
-            result += self.render(node.children[1])
-        
-        # Note: Baseline indicator would be added contextually
-        return result
-    
-    def _render_subscript(self, node: SemanticNode) -> str:
-        """!
-        @brief Render subscript.
-        
-        @details
-        Uses subscript indicator ⠰ before the subscript.
-        
-        @param node Subscript node
-        @return Nemeth subscript
-        """
-        result = ""
-        
-        # Base
-        if node.children:
-            result += self.render(node.children[0])
-        
-        # Subscript indicator + subscript
-        result += self.SUBSCRIPT_IND
-        
-        if len(node.children) > 1:
-            result += self.render(node.children[1])
-        
-        return result
-    
-    def _render_sqrt(self, node: SemanticNode) -> str:
-        """!
-        @brief Render square root.
-        
-        @details
-        Uses ⠜ to open and ⠻ to close the radical.
-        
-        @param node Square root node
-        @return Nemeth square root
-        """
-        result = self.SQRT_OPEN
-        
-        if node.children:
-            result += self.render(node.children[0])
-        
-        result += self.SQRT_CLOSE
-        return result
-    
-    def _render_nroot(self, node: SemanticNode) -> str:
-        """!
-        @brief Render n-th root.
-        
-        @param node N-th root node (index, radicand)
-        @return Nemeth n-th root
-        """
-        result = ""
-        
-        # Index first (if present)
-        if len(node.children) > 0:
-            result += self.render(node.children[0])
-        
-        result += self.SQRT_OPEN
-        
-        # Radicand
-        if len(node.children) > 1:
-            result += self.render(node.children[1])
-        
-        result += self.SQRT_CLOSE
-        return result
-    
-    def _render_sum(self, node: SemanticNode) -> str:
-        """Render summation symbol."""
-        return "⠠⠨⠎" + "".join(self.render(c) for c in node.children)
-    
-    def _render_integral(self, node: SemanticNode) -> str:
-        """Render integral symbol."""
-        return "⠮" + "".join(self.render(c) for c in node.children)
-    
     def _render_function(self, node: SemanticNode) -> str:
         """Render function name (sin, cos, etc.)."""
         # Functions are written as regular text
-        return "".join(self.LETTERS.get(c, c) for c in node.content.lower())
+        return node.content.lower().translate(self._LETTERS_TRANS)
     
     def _render_text(self, node: SemanticNode) -> str:
         """Render text content."""
-        result = ""
-        for char in node.content.lower():
-            if char in self.LETTERS:
-                result += self.LETTERS[char]
-            elif char in self.DIGITS:
-                result += self.DIGITS[char]
-            elif char == " ":
-                result += "⠀"  # Braille space
-            else:
-                result += char
-        return result
+        return self._text_to_braille(node.content)
+    
+    def _text_to_braille(self, text: str) -> str:
+        """Convert a plain text string to Nemeth Braille."""
+        return text.lower().translate(self._TEXT_TRANS)
     
     def _render_default(self, node: SemanticNode) -> str:
         """Default rendering for unknown nodes."""
         if node.content:
-            return self._render_text(SemanticNode(NodeType.TEXT, content=node.content))
-        return "".join(self.render(c) for c in node.children)
+            return self._text_to_braille(node.content)
+        return "".join(map(self.render, node.children))
@@ -14,10 +14,14 @@ standard for English Braille and includes provisions for mathematical content.
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
+from accessible_math_reader.braille._tables import LETTERS as _SHARED_LETTERS
 from accessible_math_reader.core.semantic import SemanticNode, NodeType
-from accessible_math_reader.core.renderer import BaseRenderer
+from accessible_math_reader.core.renderer import (
+    BaseRenderer, ALL_CHILDREN, compile_layouts, render_layout,
+)
 
 if TYPE_CHECKING:
     from accessible_math_reader.config import Config
@@ -45,23 +49,16 @@ class UEBConverter(BaseRenderer):
     """
     
     # UEB digits (preceded by numeric indicator when needed)
-    DIGITS = {
+    DIGITS = MappingProxyType({
         "0": "⠚", "1": "⠁", "2": "⠃", "3": "⠉", "4": "⠙",
         "5": "⠑", "6": "⠋", "7": "⠛", "8": "⠓", "9": "⠊",
-    }
+    })
     
     # UEB letters (same as literary Braille)
-    LETTERS = {
-        "a": "⠁", "b": "⠃", "c": "⠉", "d": "⠙", "e": "⠑",
-        "f": "⠋", "g": "⠛", "h": "⠓", "i": "⠊", "j": "⠚",
-        "k": "⠅", "l": "⠇", "m": "⠍", "n": "⠝", "o": "⠕",
-        "p": "⠏", "q": "⠟", "r": "⠗", "s": "⠎", "t": "⠞",
-        "u": "⠥", "v": "⠧", "w": "⠺", "x": "⠭", "y": "⠽",
-        "z": "⠵",
-    }
+    LETTERS = _SHARED_LETTERS
     
     # UEB operators
-    OPERATORS = {
+    OPERATORS = MappingProxyType({
         "+": "⠬",    # Plus
         "-": "⠤",    # Minus/hyphen
         "−": "⠤",    # Minus sign
@@ -72,17 +69,17 @@ class UEBConverter(BaseRenderer):
         ")": "⠐⠜",  # Right paren
         "[": "⠨⠣",  # Left bracket
         "]": "⠨⠜",  # Right bracket
-    }
+    })
     
     # UEB relations
-    RELATIONS = {
+    RELATIONS = MappingProxyType({
         "=": "⠐⠶",   # Equals
         "<": "⠐⠪",   # Less than
         ">": "⠐⠕",   # Greater than
         "≤": "⠐⠪⠶", # Less than or equal
         "≥": "⠐⠕⠶", # Greater than or equal
         "≠": "⠐⠶⠈⠱", # Not equal
-    }
+    })
     
     # UEB structural symbols
     NUMERIC_INDICATOR = "⠼"       # Numeric passage/symbol
@@ -92,6 +89,29 @@ class UEBConverter(BaseRenderer):
     FRACTION_LINE = "⠌"           # Horizontal line
     FRACTION_CLOSE = "⠾"          # Closing fraction indicator
     
+    # Composite node layouts for render_layout(): indicator strings,
+    # child indices (skipped when the child is missing) and ALL_CHILDREN
+    _LAYOUTS = compile_layouts({
+        NodeType.ROOT: (ALL_CHILDREN,),
+        NodeType.GROUP: (ALL_CHILDREN,),
+        NodeType.FRACTION: (FRACTION_OPEN, 0, FRACTION_LINE, 1, FRACTION_CLOSE),
+        NodeType.SUPERSCRIPT: (0, "⠔", 1),    # UEB superscript indicator
+        NodeType.SUBSCRIPT: (0, "⠢", 1),      # UEB subscript indicator
+        NodeType.SQRT: ("⠩", 0, "⠱"),         # UEB radical indicator / end radical
+    })
+    
+    # Translation tables built once at class creation. Capitals map to the
+    # capital indicator (⠠) + letter cell; U+212A KELVIN SIGN is the only
+    # non-ASCII character that lowercases to a Latin letter.
+    _CAPITALS = {letter.upper(): "⠠" + cell for letter, cell in LETTERS.items()}
+    _CAPITALS["\u212a"] = _CAPITALS["K"]
+    _LETTERS_TRANS = str.maketrans(dict(LETTERS))
+    _NUMBER_TRANS = str.maketrans({**DIGITS, ".": "⠲"})           # ⠲ = decimal point
+    _IDENTIFIER_TRANS = str.maketrans({**LETTERS, **_CAPITALS})
+    _TEXT_TRANS = str.maketrans({**LETTERS, **_CAPITALS, **DIGITS, " ": "⠀"})
+    
+    __slots__ = ("_dispatch",)
+    
     def __init__(self, config: Config | None = None) -> None:
         """!
         @brief Initialize UEB converter.
@@ -99,26 +119,25 @@ class UEBConverter(BaseRenderer):
         @param config Configuration object
         """
         super().__init__(config)
+        
+        # Leaf render methods by node type, resolved once instead of per node
+        self._dispatch = {
+            node_type: method
+            for node_type in NodeType
+            if (method := getattr(self, f"_render_{node_type.name.lower()}", None))
+        }
     
     def render(self, node: SemanticNode) -> str:
         """!
         @brief Render semantic node to UEB Braille.
         
+        @details
+        The tree is walked iteratively with render_layout().
+        
         @param node Semantic node to render
         @return UEB Braille string
         """
-        method = getattr(self, f"_render_{node.node_type.name.lower()}", None)
-        if method:
-            return method(node)
-        return self._render_default(node)
-    
-    def _render_root(self, node: SemanticNode) -> str:
-        """Render root node."""
-        return "".join(self.render(c) for c in node.children)
-    
-    def _render_group(self, node: SemanticNode) -> str:
-        """Render group node."""
-        return "".join(self.render(c) for c in node.children)
+        return render_layout(node, self._LAYOUTS, self._dispatch, self._render_default)
     
     def _render_number(self, node: SemanticNode) -> str:
         """!
@@ -127,18 +146,7 @@ class UEBConverter(BaseRenderer):
         @param node Number node
         @return UEB Braille for number
         """
-        content = node.content
-        result = self.NUMERIC_INDICATOR
-        
-        for char in content:
-            if char in self.DIGITS:
-                result += self.DIGITS[char]
-            elif char == ".":
-                result += "⠲"  # Decimal point
-            else:
-                result += char
-        
-        return result
+        return self.NUMERIC_INDICATOR + node.content.translate(self._NUMBER_TRANS)
     
     def _render_identifier(self, node: SemanticNode) -> str:
         """!
@@ -147,18 +155,7 @@ class UEBConverter(BaseRenderer):
         @param node Identifier node
         @return UEB Braille for identifier
         """
-        content = node.content
-        result = ""
-        
-        for char in content:
-            if char.isupper() and char.lower() in self.LETTERS:
-                result += self.CAPITAL_INDICATOR + self.LETTERS[char.lower()]
-            elif char.lower() in self.LETTERS:
-                result += self.LETTERS[char.lower()]
-            else:
-                result += char
-        
-        return result
+        return node.content.translate(self._IDENTIFIER_TRANS)
     
     def _render_operator(self, node: SemanticNode) -> str:
         """Render operator."""
@@ -168,86 +165,20 @@ class UEBConverter(BaseRenderer):
         """Render relation."""
         return self.RELATIONS.get(node.content, node.content)
     
-    def _render_fraction(self, node: SemanticNode) -> str:
-        """!
-        @brief Render UEB fraction.
-        
-        @param node Fraction node
-        @return UEB fraction representation
-        """
-        result = self.FRACTION_OPEN
-        
-        if node.children:
-            result += self.render(node.children[0])
-        
-        result += self.FRACTION_LINE
-        
-        if len(node.children) > 1:
-            result += self.render(node.children[1])
-        
-        result += self.FRACTION_CLOSE
-        return result
-    
-    def _render_superscript(self, node: SemanticNode) -> str:
-        """Render superscript."""
-        result = ""
-        
-        if node.children:
-            result += self.render(node.children[0])
-        
-        result += "⠔"  # UEB superscript indicator
-        
-        if len(node.children) > 1:
-            result += self.render(node.children[1])
-        
-        return result
-    
-    def _render_subscript(self, node: SemanticNode) -> str:
-        """Render subscript."""
-        result = ""
-        
-        if node.children:
-            result += self.render(node.children[0])
-        
-        result += "⠢"  # UEB subscript indicator
-        
-        if len(node.children) > 1:
-            result += self.render(node.children[1])
-        
-        return result
-    
-    def _render_sqrt(self, node: SemanticNode) -> str:
-        """Render square root."""
-        result = "⠩"  # UEB radical indicator
-        
-        if node.children:
-            result += self.render(node.children[0])
-        
-        result += "⠱"  # End radical
-        return result
-    
     def _render_function(self, node: SemanticNode) -> str:
         """Render function name."""
-        return "".join(self.LETTERS.get(c, c) for c in node.content.lower())
+        return node.content.lower().translate(self._LETTERS_TRANS)
     
     def _render_text(self, node: SemanticNode) -> str:
         """Render text."""
-        result = ""
-        for char in node.content:
-            if char.isupper() and char.lower() in self.LETTERS:
-                result += self.CAPITAL_INDICATOR + self.LETTERS[char.lower()]
-            elif char.lower() in self.LETTERS:
-                result += self.LETTERS[char.lower()]
-            elif char in self.DIGITS:
-                result += self.DIGITS[char]
-            elif char == " ":
-                result += "⠀"
-            else:
-                result += char
-        return result
+        return self._text_to_braille(node.content)
+    
+    def _text_to_braille(self, content: str) -> str:
+        """Convert a plain text string to UEB Braille."""
+        return content.translate(self._TEXT_TRANS)
     
     def _render_default(self, node: SemanticNode) -> str:
         """Default rendering."""
         if node.content:
-            return self._render_text(SemanticNode(NodeType.TEXT, content=node.content))
-        return "".join(self.render(c) for c in node.children)
+            return self._text_to_braille(node.content)
+        return "".join(map(self.render, node.children))
@@ -38,14 +38,20 @@ amr --interactive
 from __future__ import annotations
 
 import argparse
+import contextlib
+import copy
 import sys
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, TextIO
+from typing import TYPE_CHECKING, Any, Callable, Optional, TextIO
 
 from accessible_math_reader import __version__
-from accessible_math_reader.config import Config, SpeechStyle, BrailleNotation
-from accessible_math_reader.reader import MathReader
-from accessible_math_reader.core.parser import ParseError
+
+# The reader stack is imported inside main() once arguments are parsed, so
+# `amr --version`, `amr -h` and usage errors return without loading it
+if TYPE_CHECKING:
+    from accessible_math_reader.reader import MathReader
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -148,6 +154,114 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# JSON encoder for --json/--structure, resolved on first use
+_json_dumps: Optional[Callable[[Any], str]] = None
+
+
+def _get_json_dumps() -> Callable[[Any], str]:
+    """!
+    @brief Return the indented JSON encoder used for CLI output.
+    
+    @details
+    Uses orjson's C encoder when it is installed (pip install
+    accessible-math-reader[fast]) and falls back to the standard
+    library otherwise. Both write the same text: two-space indents and
+    non-ASCII characters such as Braille cells as UTF-8 rather than
+    \\u escapes, so the output does not depend on which is installed.
+    
+    @return Callable serializing an object to a JSON string
+    """
+    global _json_dumps
+    if _json_dumps is None:
+        try:
+            import orjson
+        except ImportError:
+            import json
+            
+            def dumps(obj: Any) -> str:
+                return json.dumps(obj, indent=2, ensure_ascii=False)
+        else:
+            def dumps(obj: Any) -> str:
+                return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        _json_dumps = dumps
+    return _json_dumps
+
+
+# Maximum number of rendered outputs cached per reader
+OUTPUT_CACHE_SIZE = 4096
+
+# Output kinds that may be cached. Structure dumps carry node IDs that
+# must differ between outputs, so they are always rendered afresh
+_CACHEABLE_KINDS = frozenset({"braille", "ssml", "speech"})
+
+# Memoized renderer per reader, with the configuration it was built for.
+# Weak keys, so the CLI never keeps a reader alive.
+_output_caches: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _render_output(
+    reader: MathReader,
+    expression: str,
+    kind: str,
+    notation: str,
+) -> str:
+    """!
+    @brief Render one expression for a non-audio output kind.
+    
+    @param reader MathReader instance
+    @param expression Expression to render
+    @param kind One of "structure", "json", "braille", "ssml", "speech"
+    @param notation Braille notation for the "braille" kind
+    @return Output text, without the trailing newline
+    """
+    if kind == "structure":
+        return _get_json_dumps()(reader.get_structure(expression))
+    if kind == "json":
+        return _get_json_dumps()({
+            "input": expression,
+            "speech": reader.to_speech(expression),
+            "braille": {
+                "nemeth": reader.to_braille(expression, "nemeth"),
+                "ueb": reader.to_braille(expression, "ueb"),
+            },
+            "structure": reader.get_structure(expression),
+        })
+    if kind == "braille":
+        return reader.to_braille(expression, notation)
+    if kind == "ssml":
+        return reader.to_ssml(expression)
+    return reader.to_speech(expression)
+
+
+def _cached_renderer(reader: MathReader) -> Callable[[str, str, str], str]:
+    """!
+    @brief Get the memoized _render_output() for a reader.
+    
+    @details
+    Batch inputs often repeat expressions, so finished output text is
+    cached per reader. The cache is rebuilt whenever the reader's
+    configuration differs from the snapshot it was built for, e.g.
+    after a verbosity change. It refers to the reader weakly, so it
+    goes away with the reader.
+    
+    @param reader MathReader instance
+    @return Function mapping (expression, kind, notation) to output text
+    """
+    config = reader.config
+    entry = _output_caches.get(reader)
+    if entry is not None and entry[0] == config:
+        return entry[1]
+    
+    reader_ref = weakref.ref(reader)
+    
+    @lru_cache(maxsize=OUTPUT_CACHE_SIZE)
+    def render(expression: str, kind: str, notation: str) -> str:
+        return _render_output(reader_ref(), expression, kind, notation)
+    
+    _output_caches[reader] = (copy.deepcopy(config), render)
+    return render
+
+
 def process_expression(
     reader: MathReader,
     expression: str,
@@ -157,58 +271,45 @@ def process_expression(
     """!
     @brief Process a single expression and write output.
     
+    @details
+    Speech, SSML and Braille outputs are memoized per reader (see
+    _cached_renderer()), unless the reader's configuration disables
+    caching (braille.cache_braille). Structure and JSON outputs get
+    fresh node IDs each time, and audio is always synthesized, since it
+    writes a file.
+    
     @param reader MathReader instance
     @param expression Expression to process
     @param args Parsed command-line arguments
     @param output Output stream
     @return True if successful, False if error occurred
     """
+    from accessible_math_reader.core.parser import ParseError
+    
     try:
-        if args.structure:
-            # Output structure
-            import json
-            structure = reader.get_structure(expression)
-            output.write(json.dumps(structure, indent=2))
-            output.write("\n")
-            
-        elif args.json:
-            # Full JSON output
-            import json
-            result = {
-                "input": expression,
-                "speech": reader.to_speech(expression),
-                "braille": {
-                    "nemeth": reader.to_braille(expression, "nemeth"),
-                    "ueb": reader.to_braille(expression, "ueb"),
-                },
-                "structure": reader.get_structure(expression),
-            }
-            output.write(json.dumps(result, indent=2))
-            output.write("\n")
-            
-        elif args.audio:
+        if args.audio and not (args.structure or args.json):
             # Generate audio
             audio_path = reader.to_audio(expression, args.audio)
             output.write(f"Audio saved to: {audio_path}\n")
-            
+            return True
+        
+        if args.structure:
+            kind = "structure"
+        elif args.json:
+            kind = "json"
         elif args.braille:
-            # Output Braille
-            braille = reader.to_braille(expression, args.notation)
-            output.write(braille)
-            output.write("\n")
-            
+            kind = "braille"
         elif args.ssml:
-            # Output SSML
-            ssml = reader.to_ssml(expression)
-            output.write(ssml)
-            output.write("\n")
-            
+            kind = "ssml"
         else:
-            # Default: speech text
-            speech = reader.to_speech(expression)
-            output.write(speech)
-            output.write("\n")
+            kind = "speech"
         
+        if kind in _CACHEABLE_KINDS and reader.config.braille.cache_braille:
+            text = _cached_renderer(reader)(expression, kind, args.notation)
+        else:
+            text = _render_output(reader, expression, kind, args.notation)
+        output.write(text)
+        output.write("\n")
         return True
         
     except ParseError as e:
@@ -219,19 +320,88 @@ def process_expression(
         return False
 
 
+def _cmd_quit(reader: MathReader, cmd_parts: list[str], state: dict) -> bool:
+    """Leave interactive mode."""
+    print("Goodbye!")
+    return False
+
+
+def _cmd_verbosity(reader: MathReader, cmd_parts: list[str], state: dict) -> bool:
+    """Set the speech verbosity level."""
+    if len(cmd_parts) < 2:
+        print(f"Unknown command: {cmd_parts[0].lower()}")
+        return True
+    
+    level = cmd_parts[1].lower()
+    if level in ("verbose", "concise", "superbrief"):
+        reader.set_verbosity(level)
+        print(f"Verbosity set to: {level}")
+    else:
+        print("Invalid verbosity level")
+    return True
+
+
+def _cmd_braille(reader: MathReader, cmd_parts: list[str], state: dict) -> bool:
+    """Switch to Braille output."""
+    state["mode"] = "braille"
+    print("Switched to Braille output")
+    return True
+
+
+def _cmd_speech(reader: MathReader, cmd_parts: list[str], state: dict) -> bool:
+    """Switch to speech output."""
+    state["mode"] = "speech"
+    print("Switched to speech output")
+    return True
+
+
+def _cmd_help(reader: MathReader, cmd_parts: list[str], state: dict) -> bool:
+    """List the interactive commands."""
+    print("Commands:")
+    print("  :quit         - Exit interactive mode")
+    print("  :verbosity X  - Set verbosity (verbose/concise/superbrief)")
+    print("  :braille      - Switch to Braille output")
+    print("  :speech       - Switch to speech output")
+    return True
+
+
+# Interactive-mode command handlers; each returns False to end the session
+_REPL_COMMANDS = {
+    "quit": _cmd_quit,
+    "exit": _cmd_quit,
+    "q": _cmd_quit,
+    "verbosity": _cmd_verbosity,
+    "braille": _cmd_braille,
+    "speech": _cmd_speech,
+    "help": _cmd_help,
+}
+
+
 def run_interactive(reader: MathReader, args: argparse.Namespace) -> None:
     """!
     @brief Run interactive mode.
     
+    @details
+    Commands are dispatched through the _REPL_COMMANDS table. When the
+    readline module is available, input() gains line editing and
+    up-arrow history for the session.
+    
     @param reader MathReader instance
     @param args Parsed arguments
     """
+    from accessible_math_reader.core.parser import ParseError
+    
+    with contextlib.suppress(ImportError):
+        import readline  # noqa: F401  # enables history and editing for input()
+    
     print("Accessible Math Reader - Interactive Mode")
     print("Enter mathematical expressions (LaTeX or MathML)")
     print("Commands: :quit, :verbosity <level>, :braille, :speech")
     print("-" * 50)
     
-    mode = "speech"
+    state = {"mode": "speech"}
+    commands = _REPL_COMMANDS
+    notation = args.notation
     
     while True:
         try:
@@ -244,40 +414,20 @@ def run_interactive(reader: MathReader, args: argparse.Namespace) -> None:
             continue
         
         # Handle commands
-        if line.startswith(":"):
-            cmd_parts = line[1:].split()
+        if line[0] == ":":
+            cmd_parts = line[1:].split() or [""]
             cmd = cmd_parts[0].lower()
-            
-            if cmd in ("quit", "exit", "q"):
-                print("Goodbye!")
-                break
-            elif cmd == "verbosity" and len(cmd_parts) > 1:
-                level = cmd_parts[1].lower()
-                if level in ("verbose", "concise", "superbrief"):
-                    reader.set_verbosity(level)
-                    print(f"Verbosity set to: {level}")
-                else:
-                    print("Invalid verbosity level")
-            elif cmd == "braille":
-                mode = "braille"
-                print("Switched to Braille output")
-            elif cmd == "speech":
-                mode = "speech"
-                print("Switched to speech output")
-            elif cmd == "help":
-                print("Commands:")
-                print("  :quit         - Exit interactive mode")
-                print("  :verbosity X  - Set verbosity (verbose/concise/superbrief)")
-                print("  :braille      - Switch to Braille output")
-                print("  :speech       - Switch to speech output")
-            else:
+            handler = commands.get(cmd)
+            if handler is None:
                 print(f"Unknown command: {cmd}")
+            elif not handler(reader, cmd_parts, state):
+                break
             continue
         
         # Process expression
         try:
-            if mode == "braille":
-                result = reader.to_braille(line, args.notation)
+            if state["mode"] == "braille":
+                result = reader.to_braille(line, notation)
             else:
                 result = reader.to_speech(line)
             print(result)
@@ -297,9 +447,17 @@ def main(argv: Optional[list[str]] = None) -> int:
     parser = create_parser()
     args = parser.parse_args(argv)
     
+    # No input provided
+    if not (args.interactive or args.input or args.expression):
+        parser.print_help()
+        return 1
+    
+    from accessible_math_reader.config import Config, _SPEECH_STYLE_BY_VALUE
+    from accessible_math_reader.reader import MathReader
+    
     # Create configuration
     config = Config()
-    config.speech.style = SpeechStyle(args.verbosity)
+    config.speech.style = _SPEECH_STYLE_BY_VALUE[args.verbosity]  # validated by choices
     
     # Create reader
     reader = MathReader(config)
@@ -324,26 +482,20 @@ def main(argv: Optional[list[str]] = None) -> int:
                 sys.stderr.write(f"Input file not found: {args.input}\n")
                 return 1
             
-            with open(input_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-            
+            # Stream the file so output starts with the first expression
             success = True
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    if not process_expression(reader, line, args, output):
-                        success = False
+            with open(input_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        if not process_expression(reader, line, args, output):
+                            success = False
             
             return 0 if success else 1
         
         # Process single expression
-        if args.expression:
-            success = process_expression(reader, args.expression, args, output)
-            return 0 if success else 1
-        
-        # No input provided
-        parser.print_help()
-        return 1
+        success = process_expression(reader, args.expression, args, output)
+        return 0 if success else 1
         
     finally:
         if args.output and output is not sys.stdout:
@@ -19,6 +19,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
 
+from accessible_math_reader._compat import _DATACLASS_SLOTS
+
 
 class BrailleNotation(Enum):
     """!
@@ -61,7 +63,13 @@ class SpeechStyle(Enum):
     SUPERBRIEF = "superbrief"
 
 
-@dataclass
+# Enum members by value, so hot lookups skip the EnumMeta.__call__ machinery.
+# Unknown values fall back to the Enum call to keep its ValueError.
+_SPEECH_STYLE_BY_VALUE = {style.value: style for style in SpeechStyle}
+_BRAILLE_NOTATION_BY_VALUE = {notation.value: notation for notation in BrailleNotation}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class SpeechConfig:
     """!
     @brief Configuration for speech output.
@@ -77,7 +85,7 @@ class SpeechConfig:
     announce_structure: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class BrailleConfig:
     """!
     @brief Configuration for Braille output.
@@ -106,7 +114,7 @@ class BrailleConfig:
     unsupported_fallback: str = "describe"    # "describe" | "warn" | "error"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AccessibilityConfig:
     """!
     @brief Accessibility-specific configuration.
@@ -150,7 +158,7 @@ class AccessibilityConfig:
     high_contrast: bool = False             # Will be auto-detected from prefers-contrast
 
 
-@dataclass 
+@dataclass(**_DATACLASS_SLOTS)
 class Config:
     """!
     @brief Main configuration container for Accessible Math Reader.
@@ -195,9 +203,9 @@ class Config:
         @throws FileNotFoundError If config file doesn't exist
         @throws json.JSONDecodeError If config file is invalid JSON
         """
-        path = Path(path)
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # One read and a bytes decode: json detects UTF-8/16/32 (and a BOM)
+        # itself, skipping the text-stream layer for these small files
+        data = json.loads(Path(path).read_bytes())
         return cls._from_dict(data)
     
     @classmethod
@@ -217,13 +225,17 @@ class Config:
         config = cls()
         
         if style := os.environ.get("AMR_SPEECH_STYLE"):
-            config.speech.style = SpeechStyle(style.lower())
+            style = style.lower()
+            config.speech.style = _SPEECH_STYLE_BY_VALUE.get(style) or SpeechStyle(style)
         
         if lang := os.environ.get("AMR_SPEECH_LANGUAGE"):
             config.speech.language = lang
             
         if notation := os.environ.get("AMR_BRAILLE_NOTATION"):
-            config.braille.notation = BrailleNotation(notation.lower())
+            notation = notation.lower()
+            config.braille.notation = (
+                _BRAILLE_NOTATION_BY_VALUE.get(notation) or BrailleNotation(notation)
+            )
             
         if plugin_dirs := os.environ.get("AMR_PLUGIN_DIRS"):
             config.plugin_dirs = plugin_dirs.split(os.pathsep)
@@ -242,15 +254,18 @@ class Config:
         braille_data = data.get("braille", {})
         a11y_data = data.get("accessibility", {})
         
+        style = speech_data.get("style", "verbose")
+        notation = braille_data.get("notation", "nemeth")
+        
         speech = SpeechConfig(
-            style=SpeechStyle(speech_data.get("style", "verbose")),
+            style=_SPEECH_STYLE_BY_VALUE.get(style) or SpeechStyle(style),
             language=speech_data.get("language", "en"),
             rate=speech_data.get("rate", 1.0),
             announce_structure=speech_data.get("announce_structure", True),
         )
         
         braille = BrailleConfig(
-            notation=BrailleNotation(braille_data.get("notation", "nemeth")),
+            notation=_BRAILLE_NOTATION_BY_VALUE.get(notation) or BrailleNotation(notation),
             include_indicators=braille_data.get("include_indicators", True),
         )
         
@@ -18,9 +18,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from operator import itemgetter
 from typing import TypedDict, Protocol, Optional, Any
 from typing_extensions import NotRequired
 
+from accessible_math_reader._compat import _DATACLASS_SLOTS
+
 
 # ============================================================================
 # Accessibility Metadata Types
@@ -124,7 +127,7 @@ class NavigationState(Protocol):
 # Screen Reader Output
 # ============================================================================
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ScreenReaderOutput:
     """!
     @brief Complete output package for screen readers.
@@ -156,6 +159,22 @@ class ScreenReaderOutput:
 # Accessibility Contract
 # ============================================================================
 
+# ARIA roles the renderers are expected to emit
+_VALID_ARIA_ROLES = frozenset({
+    'math', 'group', 'term', 'region', 'application',
+    'article', 'button', 'toolbar', 'status',
+})
+
+# Sentinel distinguishing an absent attribute from a falsy one
+_MISSING = object()
+
+# Allowed aria-live politeness values
+_VALID_ARIA_LIVE_VALUES = frozenset({'off', 'polite', 'assertive'})
+
+# Fetches the two required ARIA attributes in one C-level call
+_get_id_role = itemgetter('id', 'role')
+
+
 class AccessibilityContract:
     """!
     @brief Abstract base class defining accessibility guarantees.
@@ -180,15 +199,14 @@ class AccessibilityContract:
         issues = []
         
         # Check for node_id
-        if not hasattr(node, 'node_id') or not node.node_id:
+        if not getattr(node, 'node_id', None):
             issues.append("Missing node_id")
         
         # Check for accessibility_metadata
-        if not hasattr(node, 'accessibility_metadata'):
+        metadata = getattr(node, 'accessibility_metadata', _MISSING)
+        if metadata is _MISSING:
             issues.append("Missing accessibility_metadata attribute")
         else:
-            metadata = node.accessibility_metadata
-            
             # Warn if no spoken text
             if 'spoken_text' not in metadata and node.is_leaf:
                 issues.append("Leaf node missing spoken_text")
@@ -199,6 +217,47 @@ class AccessibilityContract:
         
         return (len(issues) == 0, issues)
     
+    @staticmethod
+    def validate_tree(root: Any) -> list[tuple[str, list[str]]]:
+        """!
+        @brief Validate every node of a semantic tree in one walk.
+        
+        @details
+        Applies the same checks as validate_node_accessibility() to each
+        node, iteratively, so deep trees do not recurse. Valid nodes are
+        skipped without allocating an issue list.
+        
+        @param root Root SemanticNode of the tree
+        @return (node_id, issues) pairs for nodes that failed validation,
+                in preorder; empty when the whole tree is valid
+        """
+        failures = []
+        stack = [root]
+        pop = stack.pop
+        extend = stack.extend
+        missing = _MISSING
+        
+        while stack:
+            node = pop()
+            node_id = getattr(node, 'node_id', None)
+            metadata = getattr(node, 'accessibility_metadata', missing)
+            children = node.children
+            
+            if (
+                node_id
+                and metadata is not missing
+                and 'aria_role' in metadata
+                and ('spoken_text' in metadata or children)
+            ):
+                extend(reversed(children))
+                continue
+            
+            _, issues = AccessibilityContract.validate_node_accessibility(node)
+            failures.append((node_id or "", issues))
+            extend(reversed(children))
+        
+        return failures
+    
     @staticmethod
     def validate_aria_attributes(attrs: dict[str, str]) -> tuple[bool, list[str]]:
         """!
@@ -217,22 +276,52 @@ class AccessibilityContract:
             issues.append("Missing required 'role' attribute")
         
         # Validate role values (basic check)
-        valid_roles = {
-            'math', 'group', 'term', 'region', 'application',
-            'article', 'button', 'toolbar', 'status'
-        }
-        if 'role' in attrs and attrs['role'] not in valid_roles:
+        if 'role' in attrs and attrs['role'] not in _VALID_ARIA_ROLES:
             # Allow custom roles, but warn
             pass  # Could add warning system here
         
         # Validate aria-live values
         if 'aria-live' in attrs:
-            valid_politeness = {'off', 'polite', 'assertive'}
-            if attrs['aria-live'] not in valid_politeness:
+            if attrs['aria-live'] not in _VALID_ARIA_LIVE_VALUES:
                 issues.append(f"Invalid aria-live value: {attrs['aria-live']}")
         
         return (len(issues) == 0, issues)
     
+    @staticmethod
+    def validate_aria_attributes_bulk(
+        attrs_list: list[dict[str, str]],
+    ) -> list[tuple[int, list[str]]]:
+        """!
+        @brief Validate many ARIA attribute dictionaries at once.
+        
+        @details
+        Applies the same checks as validate_aria_attributes() to each
+        dictionary. Valid dictionaries take a fast path that reads 'id'
+        and 'role' with a single itemgetter call and allocate nothing;
+        only failures go through the full check to collect messages.
+        
+        @param attrs_list ARIA attribute dictionaries, e.g. one per node
+        @return (index, issues) pairs for dictionaries that failed
+                validation, in input order; empty when all are valid
+        """
+        failures = []
+        get_id_role = _get_id_role
+        live_values = _VALID_ARIA_LIVE_VALUES
+        
+        for index, attrs in enumerate(attrs_list):
+            try:
+                node_id, role = get_id_role(attrs)
+            except KeyError:
+                pass
+            else:
+                if node_id and role and attrs.get('aria-live', 'off') in live_values:
+                    continue
+            
+            _, issues = AccessibilityContract.validate_aria_attributes(attrs)
+            failures.append((index, issues))
+        
+        return failures
+    
     @staticmethod
     def ensure_deterministic_ids(node: Any, prefix: str = "math") -> None:
         """!
@@ -245,23 +334,38 @@ class AccessibilityContract:
         @param node Root semantic node
         @param prefix Prefix for generated IDs
         """
-        def assign_ids(n: Any, path: list[int]) -> None:
-            # Generate deterministic ID from path
-            # e.g., "math-0-1-2" for root -> first child -> second child -> third child
-            id_suffix = "-".join(map(str, path)) if path else "root"
-            n.node_id = f"{prefix}-{id_suffix}"
-            
-            # Recursively assign to children
-            for i, child in enumerate(n.children):
-                assign_ids(child, path + [i])
+        # IDs encode the child-index path from the root, e.g. "math-0-1-2"
+        # for root -> first child -> second child -> third child. Each
+        # child's ID extends its parent's, so an explicit stack of
+        # (node, id base) pairs builds every ID with one format call and
+        # no recursion.
+        node.node_id = f"{prefix}-root"
+        stack = [(node, prefix)]
+        pop = stack.pop
+        push = stack.append
         
-        assign_ids(node, [])
+        while stack:
+            parent, base = pop()
+            for i, child in enumerate(parent.children):
+                child_id = f"{base}-{i}"
+                child.node_id = child_id
+                if child.children:
+                    push((child, child_id))
 
 
 # ============================================================================
 # Validation Functions
 # ============================================================================
 
+# Required ScreenReaderOutput text fields and the issue reported when empty
+_REQUIRED_OUTPUT_FIELDS = (
+    ('aria_html', "Missing ARIA HTML output"),
+    ('plain_text', "Missing plain text output"),
+    ('speech_text', "Missing speech text output"),
+    ('braille_text', "Missing Braille output"),
+)
+
+
 def validate_screen_reader_output(output: ScreenReaderOutput) -> tuple[bool, list[str]]:
     """!
     @brief Validate a complete screen reader output package.
@@ -269,20 +373,8 @@ def validate_screen_reader_output(output: ScreenReaderOutput) -> tuple[bool, lis
     @param output ScreenReaderOutput to validate
     @return Tuple of (is_valid, list_of_issues)
     """
-    issues = []
-    
     # Check required fields
-    if not output.aria_html:
-        issues.append("Missing ARIA HTML output")
-    
-    if not output.plain_text:
-        issues.append("Missing plain text output")
-    
-    if not output.speech_text:
-        issues.append("Missing speech text output")
-    
-    if not output.braille_text:
-        issues.append("Missing Braille output")
+    issues = [message for attr, message in _REQUIRED_OUTPUT_FIELDS if not getattr(output, attr)]
     
     # Validate structure
     if not output.node_structure:
@@ -13,8 +13,9 @@ Implements the roving tabindex pattern and keyboard navigation.
 
 from __future__ import annotations
 
+from collections import deque
 from enum import Enum
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 from accessible_math_reader.core.semantic import MathNavigator, SemanticNode, NodeType
 from accessible_math_reader.config import NavigationMode
@@ -23,6 +24,74 @@ if TYPE_CHECKING:
     from accessible_math_reader.config import Config
 
 
+# ============================================================================
+# Description Tables
+# ============================================================================
+
+# Sentinel for metadata lookups where a stored falsy value is meaningful
+_MISSING = object()
+
+# Spoken names and usage help announced on switch_mode()
+_MODE_NAMES = {
+    NavigationMode.BROWSE: "Browse mode",
+    NavigationMode.EXPLORE: "Explore mode",
+    NavigationMode.VERBOSE_LEARNING: "Verbose learning mode",
+}
+_MODE_HELP = {
+    NavigationMode.BROWSE: "Use arrow keys to jump between major terms.",
+    NavigationMode.EXPLORE: (
+        "Use Enter to drill down, Escape to go up, arrows to move between siblings."
+    ),
+    NavigationMode.VERBOSE_LEARNING: (
+        "Extended descriptions will be provided with pedagogical hints."
+    ),
+}
+
+# Basic descriptions for structural node types
+_STATIC_DESCRIPTIONS = {
+    NodeType.ROOT: "mathematical expression",
+    NodeType.FRACTION: "fraction",
+    NodeType.SUPERSCRIPT: "superscript",
+    NodeType.SUBSCRIPT: "subscript",
+    NodeType.SQRT: "square root",
+    NodeType.NROOT: "n-th root",
+    NodeType.SUM: "summation",
+    NodeType.INTEGRAL: "integral",
+}
+
+# Pedagogical descriptions for verbose learning mode
+_LEARNING_DESCRIPTIONS = {
+    NodeType.FRACTION: (
+        "A fraction represents division. It has a numerator (top) "
+        "and a denominator (bottom). The numerator is divided by the denominator."
+    ),
+    NodeType.SUPERSCRIPT: (
+        "A superscript represents exponentiation or power. "
+        "The base is raised to the power of the exponent."
+    ),
+    NodeType.SQRT: (
+        "A square root asks: what number, when multiplied by itself, "
+        "gives the number inside the root?"
+    ),
+    NodeType.SUM: (
+        "A summation adds up a sequence of terms. "
+        "The variable below shows what changes, and the limits show the range."
+    ),
+    NodeType.INTEGRAL: (
+        "An integral calculates the area under a curve or the accumulated change. "
+        "It's the reverse operation of differentiation."
+    ),
+}
+
+# Leaf node types described as "<prefix> <content>"
+_CONTENT_DESCRIPTION_PREFIXES = {
+    NodeType.NUMBER: "number",
+    NodeType.IDENTIFIER: "variable",
+    NodeType.OPERATOR: "operator",
+    NodeType.RELATION: "relation",
+}
+
+
 # ============================================================================
 # Focus Management
 # ============================================================================
@@ -40,6 +109,8 @@ class FocusManager:
     getting trapped or losing context.
     """
     
+    __slots__ = ("_focused_node_id", "_focus_history")
+    
     def __init__(self) -> None:
         """!
         @brief Initialize the focus manager.
@@ -140,6 +211,11 @@ class ARIANavigator(MathNavigator):
     @endcode
     """
     
+    __slots__ = (
+        "config", "_mode", "_context_help", "_focus_manager", "_announcement_queue",
+        "_announcement_cache", "_announcement_tree_key", "_sibling_positions", "_breadcrumbs",
+    )
+    
     def __init__(
         self,
         root: SemanticNode,
@@ -158,8 +234,10 @@ class ARIANavigator(MathNavigator):
         from accessible_math_reader.config import Config
         self.config = config or Config()
         
-        # Current navigation mode
+        # Current navigation mode and context-help switch, read from the
+        # config once like the mode (consulted on every keystroke)
         self._mode = self.config.accessibility.navigation_mode
+        self._context_help = self.config.accessibility.enable_context_help
         
         # Focus manager for roving tabindex
         self._focus_manager = FocusManager()
@@ -167,8 +245,23 @@ class ARIANavigator(MathNavigator):
         # Set initial focus to root
         self._focus_manager.set_focus(root.node_id)
         
-        # Announcement queue for ARIA live regions
-        self._announcement_queue: list[str] = []
+        # Announcement queue for ARIA live regions. Moves queue the
+        # (node, mode) pair and the text is built when it is dequeued.
+        self._announcement_queue: deque[
+            Union[str, tuple[SemanticNode, NavigationMode]]
+        ] = deque()
+        
+        # Announcements memoized per (node_id, mode) while the tree is
+        # structurally unchanged; see get_announcement()
+        self._announcement_cache: dict[tuple[str, NavigationMode], str] = {}
+        self._announcement_tree_key: Optional[tuple] = None
+        
+        # Navigable-sibling positions (node_id -> index) and counts per
+        # parent node_id, filled lazily; see _sibling_position()
+        self._sibling_positions: dict[str, tuple[dict[str, int], int]] = {}
+        
+        # "Where am I?" breadcrumb per node_id, each extending its parent's
+        self._breadcrumbs: dict[str, str] = {}
     
     @property
     def current_mode(self) -> NavigationMode:
@@ -195,22 +288,8 @@ class ARIANavigator(MathNavigator):
         old_mode = self._mode
         self._mode = mode
         
-        # Generate mode switch announcement
-        mode_names = {
-            NavigationMode.BROWSE: "Browse mode",
-            NavigationMode.EXPLORE: "Explore mode",
-            NavigationMode.VERBOSE_LEARNING: "Verbose learning mode"
-        }
-        
-        announcement = f"Switched to {mode_names[mode]}. "
-        
-        # Add mode-specific help
-        if mode == NavigationMode.BROWSE:
-            announcement += "Use arrow keys to jump between major terms."
-        elif mode == NavigationMode.EXPLORE:
-            announcement += "Use Enter to drill down, Escape to go up, arrows to move between siblings."
-        elif mode == NavigationMode.VERBOSE_LEARNING:
-            announcement += "Extended descriptions will be provided with pedagogical hints."
+        # Generate mode switch announcement with mode-specific help
+        announcement = f"Switched to {_MODE_NAMES[mode]}. {_MODE_HELP[mode]}"
         
         # Queue the announcement
         self._announcement_queue.append(announcement)
@@ -225,32 +304,99 @@ class ARIANavigator(MathNavigator):
         Generates appropriate announcement based on navigation mode
         and current node type. Used to populate ARIA live regions.
         
+        Results are memoized per node and mode, so revisiting a node does
+        not rebuild its text. The memo resets automatically when the tree's
+        structure or content changes (tracked through the root's
+        cache_key); call clear_announcement_cache() after editing
+        accessibility_metadata.
+        
         @return Text to announce to screen readers
         """
-        node = self.current
+        return self._announcement_for(self.current, self._mode)
+    
+    def _announcement_for(self, node: SemanticNode, mode: NavigationMode) -> str:
+        """Return the memoized announcement for a node in a given mode."""
+        self._check_tree_unchanged()
+        
+        key = (node.node_id, mode)
+        announcement = self._announcement_cache.get(key)
+        if announcement is None:
+            announcement = self._build_announcement(node, mode)
+            self._announcement_cache[key] = announcement
+        return announcement
+    
+    def clear_announcement_cache(self) -> None:
+        """!
+        @brief Drop memoized announcements and breadcrumbs.
+        
+        @details
+        Needed only after accessibility_metadata of nodes in this tree
+        is edited; structural changes are detected automatically.
+        """
+        self._announcement_cache.clear()
+        self._breadcrumbs.clear()
+    
+    def _check_tree_unchanged(self) -> None:
+        """Drop tree-derived memos if the tree structure has changed."""
+        # cache_key is rebuilt from the tree on each read, so any edit of
+        # node types, content or children changes it
+        tree_key = self._root.cache_key
+        if tree_key != self._announcement_tree_key:
+            self._announcement_cache.clear()
+            self._sibling_positions.clear()
+            self._breadcrumbs.clear()
+            self._announcement_tree_key = tree_key
+    
+    def _sibling_position(self, node: SemanticNode) -> tuple[int, int]:
+        """!
+        @brief Locate a node among its parent's navigable children.
+        
+        @details
+        Replaces a linear siblings.index() scan (whose misses compare
+        whole subtrees through dataclass equality) with a per-parent
+        position table built once.
+        
+        @param node Node with a parent
+        @return (index, sibling count); index is -1 if the node is not
+                itself navigable (e.g. a flattened GROUP)
+        """
+        self._check_tree_unchanged()
+        
+        parent = node.parent
+        entry = self._sibling_positions.get(parent.node_id)
+        if entry is None:
+            siblings = parent.get_navigable_children()
+            positions = {sibling.node_id: i for i, sibling in enumerate(siblings)}
+            entry = self._sibling_positions[parent.node_id] = (positions, len(siblings))
+        
+        positions, count = entry
+        return positions.get(node.node_id, -1), count
+    
+    def _build_announcement(self, node: SemanticNode, mode: NavigationMode) -> str:
+        """Build the announcement for a node in the given mode (uncached)."""
+        metadata = node.accessibility_metadata
         
         # Use pre-computed spoken text if available
-        if 'spoken_text' in node.accessibility_metadata:
-            base_text = node.accessibility_metadata['spoken_text']
-        else:
+        base_text = metadata.get('spoken_text', _MISSING)
+        if base_text is _MISSING:
             # Generate from node type and content
             base_text = self._generate_description(node)
         
         # Enhance based on mode
-        if self._mode == NavigationMode.BROWSE:
+        if mode == NavigationMode.BROWSE:
             # Brief overview
             return base_text
         
-        elif self._mode == NavigationMode.EXPLORE:
+        elif mode == NavigationMode.EXPLORE:
             # Add navigation hint
-            hint = node.accessibility_metadata.get('navigation_hint', '')
+            hint = metadata.get('navigation_hint', '')
             if not hint:
                 hint = self._generate_navigation_hint(node)
             return f"{base_text}. {hint}"
         
-        elif self._mode == NavigationMode.VERBOSE_LEARNING:
+        elif mode == NavigationMode.VERBOSE_LEARNING:
             # Add detailed description and pedagogical hints
-            description = node.accessibility_metadata.get('description', '')
+            description = metadata.get('description', '')
             if not description:
                 description = self._generate_verbose_description(node)
             return f"{base_text}. {description}"
@@ -264,29 +410,18 @@ class ARIANavigator(MathNavigator):
         @param node Node to describe
         @return Description text
         """
-        node_type = node.node_type
-        
         # Use aria_label if available
-        if 'aria_label' in node.accessibility_metadata:
-            return node.accessibility_metadata['aria_label']
+        label = node.accessibility_metadata.get('aria_label', _MISSING)
+        if label is not _MISSING:
+            return label
         
         # Generate based on node type
-        descriptions = {
-            NodeType.ROOT: "mathematical expression",
-            NodeType.NUMBER: f"number {node.content}",
-            NodeType.IDENTIFIER: f"variable {node.content}",
-            NodeType.FRACTION: "fraction",
-            NodeType.SUPERSCRIPT: "superscript",
-            NodeType.SUBSCRIPT: "subscript",
-            NodeType.SQRT: "square root",
-            NodeType.NROOT: "n-th root",
-            NodeType.SUM: "summation",
-            NodeType.INTEGRAL: "integral",
-            NodeType.OPERATOR: f"operator {node.content}",
-            NodeType.RELATION: f"relation {node.content}",
-        }
+        node_type = node.node_type
+        prefix = _CONTENT_DESCRIPTION_PREFIXES.get(node_type)
+        if prefix is not None:
+            return f"{prefix} {node.content}"
         
-        return descriptions.get(node_type, node_type.name.lower())
+        return _STATIC_DESCRIPTIONS.get(node_type) or node_type.name.lower()
     
     def _generate_navigation_hint(self, node: SemanticNode) -> str:
         """!
@@ -299,22 +434,21 @@ class ARIANavigator(MathNavigator):
         
         # Can we go deeper?
         if node.children:
-            hints.append(\"Press Enter to explore\")
+            hints.append("Press Enter to explore")
         
         # Can we go to siblings?
         if node.parent:
-            siblings = node.parent.get_navigable_children()
-            idx = siblings.index(node) if node in siblings else -1
+            idx, count = self._sibling_position(node)
             if idx > 0:
-                hints.append(\"Left arrow for previous\")
-            if idx < len(siblings) - 1:
-                hints.append(\"Right arrow for next\")
+                hints.append("Left arrow for previous")
+            if idx < count - 1:
+                hints.append("Right arrow for next")
         
         # Can we go up?
         if node.parent and node.parent.node_type != NodeType.ROOT:
-            hints.append(\"Escape to go up\")
+            hints.append("Escape to go up")
         
-        return \". \".join(hints) if hints else \"No navigation available\"
+        return ". ".join(hints) if hints else "No navigation available"
     
     def _generate_verbose_description(self, node: SemanticNode) -> str:
         """!
@@ -323,33 +457,10 @@ class ARIANavigator(MathNavigator):
         @param node Node to describe
         @return Verbose description with learning hints
         """
-        node_type = node.node_type
-        
-        # Pedagogical descriptions for learning mode
-        descriptions = {
-            NodeType.FRACTION: (
-                \"A fraction represents division. It has a numerator (top) \"
-                \"and a denominator (bottom). The numerator is divided by the denominator.\"
-            ),
-            NodeType.SUPERSCRIPT: (
-                \"A superscript represents exponentiation or power. \"
-                \"The base is raised to the power of the exponent.\"
-            ),
-            NodeType.SQRT: (
-                \"A square root asks: what number, when multiplied by itself, \"
-                \"gives the number inside the root?\"
-            ),
-            NodeType.SUM: (
-                \"A summation adds up a sequence of terms. \"
-                \"The variable below shows what changes, and the limits show the range.\"
-            ),
-            NodeType.INTEGRAL: (
-                \"An integral calculates the area under a curve or the accumulated change. \"
-                \"It's the reverse operation of differentiation.\"
-            ),
-        }
-        
-        return descriptions.get(node_type, self._generate_description(node))
+        description = _LEARNING_DESCRIPTIONS.get(node.node_type)
+        if description is None:
+            description = self._generate_description(node)
+        return description
     
     def get_aria_attributes(self) -> dict[str, str]:
         """!
@@ -381,103 +492,43 @@ class ARIANavigator(MathNavigator):
         
         # Navigation commands
         if node.children:
-            commands[\"Explore this element\"] = \"Enter\"
+            commands["Explore this element"] = "Enter"
         
         if node.parent:
-            siblings = node.parent.get_navigable_children()
-            idx = siblings.index(node) if node in siblings else -1
+            idx, count = self._sibling_position(node)
             
             if idx > 0:
-                commands[\"Previous sibling\"] = \"Left Arrow\"
-            if idx < len(siblings) - 1:
-                commands[\"Next sibling\"] = \"Right Arrow\"
+                commands["Previous sibling"] = "Left Arrow"
+            if idx < count - 1:
+                commands["Next sibling"] = "Right Arrow"
             
             if node.parent.node_type != NodeType.ROOT:
-                commands[\"Go to parent\"] = \"Escape\"
+                commands["Go to parent"] = "Escape"
         
         # Mode switching
-        commands[\"Switch mode\"] = \"M\"
+        commands["Switch mode"] = "M"
         
         # Context help
-        if self.config.accessibility.enable_context_help:
-            commands[\"Where am I?\"] = \"?\"
+        if self._context_help:
+            commands["Where am I?"] = "?"
         
         # Help
-        commands[\"Show all shortcuts\"] = \"H\"
+        commands["Show all shortcuts"] = "H"
         
         return commands
     
-    def enter(self) -> bool:
-        """!
-        @brief Move into current node's children with focus update.
-        
-        @return True if successful, False otherwise
-        """
-        success = super().enter()
-        
-        if success:
-            # Update focus
-            self._focus_manager.set_focus(self.current.node_id)
-            
-            # Queue announcement
-            announcement = self.get_announcement()
-            self._announcement_queue.append(announcement)
-        
-        return success
-    
-    def exit(self) -> bool:
-        """!
-        @brief Move to parent node with focus update.
-        
-        @return True if successful, False otherwise
-        """
-        success = super().exit()
-        
-        if success:
-            # Update focus
-            self._focus_manager.set_focus(self.current.node_id)
-            
-            # Queue announcement
-            announcement = self.get_announcement()
-            self._announcement_queue.append(announcement)
-        
-        return success
-    
-    def next(self) -> bool:
+    def _on_move(self) -> None:
         """!
-        @brief Move to next sibling with focus update.
+        @brief Update focus and queue an announcement after each move.
         
-        @return True if successful, False otherwise
-        """
-        success = super().next()
-        
-        if success:
-            # Update focus
-            self._focus_manager.set_focus(self.current.node_id)
-            
-            # Queue announcement
-            announcement = self.get_announcement()
-            self._announcement_queue.append(announcement)
-        
-        return success
-    
-    def previous(self) -> bool:
-        """!
-        @brief Move to previous sibling with focus update.
-        
-        @return True if successful, False otherwise
+        @details
+        Called by MathNavigator after a successful enter(), exit(),
+        next() or previous(). Only the node and mode are queued; the text
+        is built by get_next_announcement(), so moves the frontend never
+        reads announcements for cost no string work.
         """
-        success = super().previous()
-        
-        if success:
-            # Update focus
-            self._focus_manager.set_focus(self.current.node_id)
-            
-            # Queue announcement
-            announcement = self.get_announcement()
-            self._announcement_queue.append(announcement)
-        
-        return success
+        self._focus_manager.set_focus(self._current.node_id)
+        self._announcement_queue.append((self._current, self._mode))
     
     def get_next_announcement(self) -> Optional[str]:
         """!
@@ -489,9 +540,12 @@ class ARIANavigator(MathNavigator):
         
         @return Next announcement text, or None if queue is empty
         """
-        if self._announcement_queue:
-            return self._announcement_queue.pop(0)
-        return None
+        if not self._announcement_queue:
+            return None
+        entry = self._announcement_queue.popleft()
+        if isinstance(entry, str):
+            return entry
+        return self._announcement_for(*entry)
     
     def clear_announcements(self) -> None:
         """!
@@ -499,9 +553,42 @@ class ARIANavigator(MathNavigator):
         """
         self._announcement_queue.clear()
     
+    def _breadcrumb(self, node: SemanticNode) -> str:
+        """!
+        @brief Get the root-to-node breadcrumb trail for a node.
+        
+        @details
+        Breadcrumbs are memoized per node, and each extends its parent's,
+        so a move costs one label plus one concatenation rather than a
+        rebuild of the whole path.
+        
+        @param node Node to describe
+        @return Labels from the root down to the node, joined by " → "
+        """
+        self._check_tree_unchanged()
+        crumbs = self._breadcrumbs
+        
+        # Collect ancestors up to the nearest one already memoized
+        pending = []
+        while node is not None and node.node_id not in crumbs:
+            pending.append(node)
+            node = node.parent
+        
+        crumb = crumbs[node.node_id] if node is not None else None
+        for n in reversed(pending):
+            if n.node_type == NodeType.ROOT:
+                label = "Root"
+            elif 'aria_label' in n.accessibility_metadata:
+                label = n.accessibility_metadata['aria_label']
+            else:
+                label = self._generate_description(n)
+            crumb = label if crumb is None else f"{crumb} → {label}"
+            crumbs[n.node_id] = crumb
+        return crumb
+    
     def get_context(self) -> str:
         """!
-        @brief Get \"Where am I?\" context information.
+        @brief Get "Where am I?" context information.
         
         @details
         Provides breadcrumb trail and position information.
@@ -509,23 +596,11 @@ class ARIANavigator(MathNavigator):
         
         @return Context description with breadcrumb trail
         """
-        if not self.config.accessibility.enable_context_help:
-            return \"Context help is disabled\"
-        
-        # Get path from root to current
-        path = self.get_path()
-        
-        # Build breadcrumb
-        breadcrumb_parts = []
-        for node in path:
-            if node.node_type == NodeType.ROOT:
-                breadcrumb_parts.append(\"Root\")
-            elif 'aria_label' in node.accessibility_metadata:
-                breadcrumb_parts.append(node.accessibility_metadata['aria_label'])
-            else:
-                breadcrumb_parts.append(self._generate_description(node))
+        if not self._context_help:
+            return "Context help is disabled"
         
-        breadcrumb = \" → \".join(breadcrumb_parts)
+        # Breadcrumb trail from the root to the current node
+        breadcrumb = self._breadcrumb(self.current)
         
         # Add current position info
         current_desc = self._generate_description(self.current)
@@ -534,7 +609,7 @@ class ARIANavigator(MathNavigator):
         hints = self._generate_navigation_hint(self.current)
         
         return (
-            f\"You are at: {breadcrumb}\\n\"
-            f\"Current element: {current_desc}\\n\"
-            f\"Available actions: {hints}\"
+            f"You are at: {breadcrumb}\n"
+            f"Current element: {current_desc}\n"
+            f"Available actions: {hints}"
         )
@@ -16,14 +16,12 @@ Generates semantic HTML with:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import Optional
 from html import escape
 
+from accessible_math_reader.config import Config
 from accessible_math_reader.core.semantic import SemanticNode, NodeType
 
-if TYPE_CHECKING:
-    from accessible_math_reader.config import Config
-
 
 # ============================================================================
 # ARIA Renderer
@@ -50,74 +48,127 @@ def render_to_aria_html(
     @param initial_focus Whether this node should have initial focus (tabindex=0)
     @return HTML string with full ARIA markup
     """
-    from accessible_math_reader.config import Config
     config = config or Config()
     
-    # Start building HTML
-    html_parts = []
-    
-    # Add wrapper div with role="math"
-    html_parts.append(f'<div role="math" aria-label="Mathematical expression" id="{node.node_id}-container">')
-    
-    # Render the node tree
-    html_parts.append(_render_node(node, config, initial_focus))
+    # Every fragment goes into one list, joined once at the end
+    out = [f'<div role="math" aria-label="Mathematical expression" id="{node.node_id}-container">']
+    _render_node(node, config, out, initial_focus)
+    out.append('</div>')
     
-    # Close wrapper
-    html_parts.append('</div>')
-    
-    return ''.join(html_parts)
+    return ''.join(out)
+
 
+# data-math-type attribute value per node type
+_MATH_TYPE_NAMES = {node_type: node_type.name.lower() for node_type in NodeType}
 
-def _render_node(node: SemanticNode, config: Config, is_focused: bool = False, depth: int = 0) -> str:
+
+def _node_markup(node: SemanticNode) -> tuple[str, str, str]:
     """!
-    @brief Recursively render a node with ARIA attributes.
+    @brief Return the markup surrounding a node's children.
+    
+    @details
+    The opening markup is the tag with the node's escaped ARIA
+    attributes, tabindex and data-math-type, followed by the escaped
+    content of a leaf. The closing markup is the end tag plus the hidden
+    description element, if any. All three strings are memoized on
+    the node along with everything they depend on: node type, content,
+    node ID, accessibility metadata and child IDs. They are rebuilt
+    whenever any of these differs, so ensure_deterministic_ids(),
+    metadata edits and add_child() need no explicit invalidation.
+    Re-rendering an unchanged tree, e.g. for each focus change, then
+    costs one key comparison per node.
     
     @param node Node to render
-    @param config Configuration
-    @param is_focused Whether this node should receive initial focus
-    @param depth Current depth in tree (for indentation in output)
-    @return HTML string for this node and its children
+    @return (opening markup with tabindex="-1", opening markup with
+            tabindex="0", closing markup)
     """
-    parts = []
+    children = node.children
+    metadata = node.accessibility_metadata
+    key = (
+        node.node_type,
+        node.content,
+        node.node_id,
+        tuple(metadata.items()),
+        tuple([child.node_id for child in children]),
+    )
+    cached = node._aria_attr_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
     
-    # Get ARIA attributes from node
     attrs = node.get_aria_attributes()
-    
-    # Override tabindex based on focus state
-    attrs['tabindex'] = '0' if is_focused else '-1'
-    
-    # Add data attribute for node type (useful for CSS styling)
-    attrs['data-math-type'] = node.node_type.name.lower()
-    
-    # Build attribute string
     attr_str = ' '.join(f'{k}="{escape(str(v))}"' for k, v in attrs.items())
     
-    # Choose element type based on node
-    elem_type = 'div' if node.children else 'span'
-    
-    # Open tag
-    parts.append(f'<{elem_type} {attr_str}>')
+    # Choose element type based on node; data-math-type is useful for CSS
+    elem_type = 'div' if children else 'span'
+    math_type = _MATH_TYPE_NAMES[node.node_type]
     
     # Add visible content for leaf nodes
-    if node.is_leaf and node.content:
-        parts.append(escape(node.content))
-    
-    # Recursively render children
-    for i, child in enumerate(node.children):
-        # Only first child of root gets initial focus
-        child_focused = is_focused and i == 0 and depth == 0
-        parts.append(_render_node(child, config, child_focused, depth + 1))
-    
-    # Close tag
-    parts.append(f'</{elem_type}>')
+    text = escape(node.content) if not children and node.content else ''
     
     # Add hidden description element if description exists
-    if 'description' in node.accessibility_metadata:
+    close = f'</{elem_type}>'
+    if 'description' in metadata:
         desc_id = f"{node.node_id}-desc"
-        desc_text = escape(node.accessibility_metadata['description'])
-        parts.append(f'<div id="{desc_id}" class="sr-only" hidden>{desc_text}</div>')
+        desc_text = escape(metadata['description'])
+        close += f'<div id="{desc_id}" class="sr-only" hidden>{desc_text}</div>'
     
-    return ''.join(parts)
+    markup = (
+        f'<{elem_type} {attr_str} tabindex="-1" data-math-type="{math_type}">{text}',
+        f'<{elem_type} {attr_str} tabindex="0" data-math-type="{math_type}">{text}',
+        close,
+    )
+    node._aria_attr_cache = (key, markup)
+    return markup
+
+
+def _render_node(
+    node: SemanticNode,
+    config: Config,
+    out: list[str],
+    is_focused: bool = False,
+    depth: int = 0,
+) -> None:
+    """!
+    @brief Render a node and its subtree with ARIA attributes.
+    
+    @details
+    Walks the subtree iteratively and appends every HTML fragment to
+    the caller's list, so a whole document is joined exactly once and
+    deep trees do not hit the recursion limit. The stack holds either
+    (node, is_focused, depth) entries still to be opened or literal
+    closing fragments waiting for their subtree to finish.
+    
+    @param node Node to render
+    @param config Configuration
+    @param out List receiving the HTML fragments, in document order
+    @param is_focused Whether this node should receive initial focus
+    @param depth Depth of the node in the tree
+    """
+    append = out.append
+    stack: list = [(node, bool(is_focused), depth)]
+    pop = stack.pop
+    push = stack.append
+    
+    while stack:
+        item = pop()
+        if type(item) is str:
+            append(item)
+            continue
+        
+        node, is_focused, depth = item
+        children = node.children
+        
+        # Opening tag (tabindex from the focus state) and leaf content now;
+        # closing tag and description once the children are done
+        markup = _node_markup(node)
+        append(markup[is_focused])
+        push(markup[2])
+        
+        # Children, pushed in reverse so they pop in document order.
+        # Only the first child of the root gets initial focus.
+        child_depth = depth + 1
+        for i in range(len(children) - 1, -1, -1):
+            push((children[i], is_focused and i == 0 and depth == 0, child_depth))
 
 
 def render_with_focus_indicator(
@@ -137,20 +188,39 @@ def render_with_focus_indicator(
     @param focused_node_id ID of node that should be focused
     @return HTML with correct tabindex values
     """
-    from accessible_math_reader.config import Config
     config = config or Config()
     
     # Similar to render_to_aria_html but with dynamic focus
-    def render_with_focus(n: SemanticNode, depth: int = 0) -> str:
-        is_focused = n.node_id == focused_node_id
-        return _render_node(n, config, is_focused, depth)
+    out = [f'<div role="math" aria-label="Mathematical expression" id="{node.node_id}-container">']
+    _render_node(node, config, out, node.node_id == focused_node_id)
+    out.append('</div>')
     
-    html_parts = []
-    html_parts.append(f'<div role="math" aria-label="Mathematical expression" id="{node.node_id}-container">')
-    html_parts.append(render_with_focus(node))
-    html_parts.append('</div>')
+    return ''.join(out)
+
+
+def focus_delta(
+    old_focus_id: Optional[str],
+    new_focus_id: Optional[str]
+) -> dict[str, str]:
+    """!
+    @brief Compute the tabindex changes for a focus move.
     
-    return ''.join(html_parts)
+    @details
+    Roving tabindex means a focus change only touches two elements, so
+    after the initial render a client can apply this mapping (e.g. with
+    element.setAttribute('tabindex', value) per ID) instead of replacing
+    the whole tree with render_with_focus_indicator().
+    
+    @param old_focus_id ID of the previously focused node, or None
+    @param new_focus_id ID of the newly focused node, or None
+    @return Dictionary mapping node IDs to new tabindex values
+    """
+    delta = {}
+    if old_focus_id and old_focus_id != new_focus_id:
+        delta[old_focus_id] = '-1'
+    if new_focus_id:
+        delta[new_focus_id] = '0'
+    return delta
 
 
 def generate_live_region_html() -> str:
@@ -174,6 +244,24 @@ def generate_live_region_html() -> str:
     )
 
 
+# Static opening and closing markup of the keyboard shortcuts dialog
+_SHORTCUTS_DIALOG_HEAD = '\n'.join((
+    '<dialog id="keyboard-shortcuts-dialog" aria-labelledby="shortcuts-title">',
+    '  <h2 id="shortcuts-title">Keyboard Shortcuts</h2>',
+    '  <table>',
+    '    <thead>',
+    '      <tr><th>Action</th><th>Key</th></tr>',
+    '    </thead>',
+    '    <tbody>',
+))
+_SHORTCUTS_DIALOG_TAIL = '\n'.join((
+    '    </tbody>',
+    '  </table>',
+    '  <button id="close-shortcuts" autofocus>Close</button>',
+    '</dialog>',
+))
+
+
 def generate_keyboard_shortcuts_dialog(shortcuts: dict[str, str]) -> str:
     """!
     @brief Generate HTML for keyboard shortcuts help dialog.
@@ -181,23 +269,12 @@ def generate_keyboard_shortcuts_dialog(shortcuts: dict[str, str]) -> str:
     @param shortcuts Dictionary mapping descriptions to key bindings
     @return HTML for dialog
     """
-    parts = []
-    
-    parts.append('<dialog id="keyboard-shortcuts-dialog" aria-labelledby="shortcuts-title">')
-    parts.append('  <h2 id="shortcuts-title">Keyboard Shortcuts</h2>')
-    parts.append('  <table>')
-    parts.append('    <thead>')
-    parts.append('      <tr><th>Action</th><th>Key</th></tr>')
-    parts.append('    </thead>')
-    parts.append('    <tbody>')
+    parts = [_SHORTCUTS_DIALOG_HEAD]
     
     for action, key in shortcuts.items():
         parts.append(f'      <tr><td>{escape(action)}</td><td><kbd>{escape(key)}</kbd></td></tr>')
     
-    parts.append('    </tbody>')
-    parts.append('  </table>')
-    parts.append('  <button id="close-shortcuts" autofocus>Close</button>')
-    parts.append('</dialog>')
+    parts.append(_SHORTCUTS_DIALOG_TAIL)
     
     return '\n'.join(parts)
 
@@ -106,6 +106,34 @@ class MathParser:
         "\\le": "≤", "\\ge": "≥", "\\ne": "≠",
     }
     
+    # LaTeX command name following a backslash
+    _COMMAND_RE = re.compile(r"\\([a-zA-Z]+)")
+    
+    # Command lookup tables built once at class creation. Greek commands
+    # match case-insensitively and the first GREEK_LETTERS entry wins, as
+    # with the original linear scan. Every other argument-free command
+    # maps, without its backslash, to the (node type, content) of the
+    # single node it produces.
+    _GREEK_BY_LOWER = {name.lower(): value for name, value in reversed(GREEK_LETTERS.items())}
+    _COMMAND_NODES = {
+        "sum": (NodeType.SUM, "∑"),
+        "prod": (NodeType.PRODUCT, "∏"),
+        "int": (NodeType.INTEGRAL, "∫"),
+        "infty": (NodeType.IDENTIFIER, "∞"),
+        **{
+            name[1:]: (NodeType.OPERATOR, value)
+            for name, value in OPERATORS.items() if name.startswith("\\")
+        },
+        **{
+            name[1:]: (NodeType.RELATION, value)
+            for name, value in RELATIONS.items() if name.startswith("\\")
+        },
+        **{
+            name: (NodeType.FUNCTION, name)
+            for name in ("sin", "cos", "tan", "log", "ln", "exp", "lim")
+        },
+    }
+    
     def parse(self, input_str: str) -> SemanticNode:
         """!
         @brief Parse mathematical input, auto-detecting format.
@@ -133,18 +161,38 @@ class MathParser:
         latex = latex.strip().strip("$").strip()
         
         root = SemanticNode(NodeType.ROOT, metadata={"source": latex})
-        self._parse_latex_tokens(latex, root)
+        try:
+            self._parse_latex_tokens(latex, root)
+        except RecursionError:
+            # Groups nest through recursion, so bound pathological input
+            # such as {{{{...}}}} by the interpreter's stack limit
+            raise ParseError("Expression is nested too deeply", None, latex) from None
         return root
     
-    def _parse_latex_tokens(self, latex: str, parent: SemanticNode) -> None:
+    def _parse_latex_tokens(
+        self,
+        latex: str,
+        parent: SemanticNode,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> None:
         """!
         @brief Parse LaTeX tokens and add to parent node.
         
-        @param latex LaTeX substring to parse
+        @details
+        Groups are parsed in place as index ranges of the full string,
+        so nested braces never copy their contents.
+        
+        @param latex Full LaTeX string
         @param parent Parent node to add children to
+        @param start Position of the first character to parse
+        @param end Position after the last character to parse
+                   (defaults to the end of the string)
         """
-        pos = 0
-        while pos < len(latex):
+        if end is None:
+            end = len(latex)
+        pos = start
+        while pos < end:
             char = latex[pos]
             
             # Skip whitespace
@@ -154,129 +202,96 @@ class MathParser:
             
             # Handle commands (backslash)
             if char == "\\":
-                pos = self._parse_latex_command(latex, pos, parent)
+                pos = self._parse_latex_command(latex, pos, parent, end)
             
             # Handle superscript
             elif char == "^":
-                pos = self._parse_latex_super(latex, pos, parent)
+                pos = self._parse_latex_super(latex, pos, parent, end)
             
             # Handle subscript
             elif char == "_":
-                pos = self._parse_latex_sub(latex, pos, parent)
+                pos = self._parse_latex_sub(latex, pos, parent, end)
             
             # Handle groups
             elif char == "{":
-                end = self._find_matching_brace(latex, pos)
-                group_content = latex[pos + 1:end]
+                group_end = self._find_matching_brace(latex, pos, end)
                 group = SemanticNode(NodeType.GROUP)
-                self._parse_latex_tokens(group_content, group)
+                self._parse_latex_tokens(latex, group, pos + 1, group_end)
                 parent.add_child(group)
-                pos = end + 1
+                pos = group_end + 1
             
             elif char == "(":
-                parent.add_child(SemanticNode(NodeType.OPERATOR, content="("))
+                parent.add_child(SemanticNode.leaf(NodeType.OPERATOR, "("))
                 pos += 1
             
             elif char == ")":
-                parent.add_child(SemanticNode(NodeType.OPERATOR, content=")"))
+                parent.add_child(SemanticNode.leaf(NodeType.OPERATOR, ")"))
                 pos += 1
             
             # Handle operators
             elif char in "+-*/":
                 op = self.OPERATORS.get(char, char)
-                parent.add_child(SemanticNode(NodeType.OPERATOR, content=op))
+                parent.add_child(SemanticNode.leaf(NodeType.OPERATOR, op))
                 pos += 1
             
             # Handle relations
             elif char in "=<>":
                 rel = self.RELATIONS.get(char, char)
-                parent.add_child(SemanticNode(NodeType.RELATION, content=rel))
+                parent.add_child(SemanticNode.leaf(NodeType.RELATION, rel))
                 pos += 1
             
             # Handle numbers
-            elif char.isdigit() or (char == "." and pos + 1 < len(latex) and latex[pos + 1].isdigit()):
-                num, end = self._parse_number(latex, pos)
-                parent.add_child(SemanticNode(NodeType.NUMBER, content=num))
-                pos = end
+            elif char.isdigit() or (char == "." and pos + 1 < end and latex[pos + 1].isdigit()):
+                num, pos = self._parse_number(latex, pos, end)
+                parent.add_child(SemanticNode.leaf(NodeType.NUMBER, num))
             
             # Handle identifiers (variables)
             elif char.isalpha():
-                parent.add_child(SemanticNode(NodeType.IDENTIFIER, content=char))
+                parent.add_child(SemanticNode.leaf(NodeType.IDENTIFIER, char))
                 pos += 1
             
             else:
                 # Unknown character - add as text
-                parent.add_child(SemanticNode(NodeType.TEXT, content=char))
+                parent.add_child(SemanticNode.leaf(NodeType.TEXT, char))
                 pos += 1
     
-    def _parse_latex_command(self, latex: str, pos: int, parent: SemanticNode) -> int:
+    def _parse_latex_command(
+        self, latex: str, pos: int, parent: SemanticNode, end: int
+    ) -> int:
         """!
         @brief Parse a LaTeX command starting at pos.
         
         @param latex Full LaTeX string
         @param pos Position of the backslash
         @param parent Parent node
+        @param end End of the range being parsed
         @return Position after the command
         """
-        # Extract command name
-        match = re.match(r"\\([a-zA-Z]+)", latex[pos:])
+        # Extract command name, matching in place rather than on a slice
+        match = self._COMMAND_RE.match(latex, pos, end)
         if not match:
             # Single character command like \\
             return pos + 1
         
         cmd = match.group(1)
-        cmd_end = pos + len(match.group(0))
+        cmd_end = match.end()
         
         # Handle fraction
         if cmd == "frac":
-            return self._parse_frac(latex, cmd_end, parent)
+            return self._parse_frac(latex, cmd_end, parent, end)
         
         # Handle square root
         elif cmd == "sqrt":
-            return self._parse_sqrt(latex, cmd_end, parent)
-        
-        # Handle sum/product/integral
-        elif cmd == "sum":
-            parent.add_child(SemanticNode(NodeType.SUM, content="∑"))
-            return cmd_end
+            return self._parse_sqrt(latex, cmd_end, parent, end)
         
-        elif cmd == "prod":
-            parent.add_child(SemanticNode(NodeType.PRODUCT, content="∏"))
-            return cmd_end
-        
-        elif cmd == "int":
-            parent.add_child(SemanticNode(NodeType.INTEGRAL, content="∫"))
+        # Handle big operators, operators, relations, symbols and functions
+        elif (leaf := self._COMMAND_NODES.get(cmd)) is not None:
+            parent.add_child(SemanticNode.leaf(*leaf))
             return cmd_end
         
         # Handle Greek letters
-        elif cmd.lower() in [k.lower() for k in self.GREEK_LETTERS]:
-            # Find the correct case
-            for key, value in self.GREEK_LETTERS.items():
-                if key.lower() == cmd.lower():
-                    parent.add_child(SemanticNode(NodeType.IDENTIFIER, content=value))
-                    break
-            return cmd_end
-        
-        # Handle operators
-        elif f"\\{cmd}" in self.OPERATORS:
-            op = self.OPERATORS[f"\\{cmd}"]
-            parent.add_child(SemanticNode(NodeType.OPERATOR, content=op))
-            return cmd_end
-        
-        # Handle relations
-        elif f"\\{cmd}" in self.RELATIONS:
-            rel = self.RELATIONS[f"\\{cmd}"]
-            parent.add_child(SemanticNode(NodeType.RELATION, content=rel))
-            return cmd_end
-        
-        # Handle special symbols
-        elif cmd == "infty":
-            parent.add_child(SemanticNode(NodeType.IDENTIFIER, content="∞"))
-            return cmd_end
-        
-        # Handle functions (sin, cos, log, etc.)
-        elif cmd in ("sin", "cos", "tan", "log", "ln", "exp", "lim"):
-            parent.add_child(SemanticNode(NodeType.FUNCTION, content=cmd))
+        elif (greek := self._GREEK_BY_LOWER.get(cmd.lower())) is not None:
+            parent.add_child(SemanticNode.leaf(NodeType.IDENTIFIER, greek))
             return cmd_end
         
         # Unknown command - preserve as text
@@ -288,96 +303,106 @@ class MathParser:
             ))
             return cmd_end
     
-    def _parse_frac(self, latex: str, pos: int, parent: SemanticNode) -> int:
+    def _parse_frac(
+        self, latex: str, pos: int, parent: SemanticNode, end: int
+    ) -> int:
         """!
         @brief Parse a \\frac{num}{denom} command.
         
         @param latex Full LaTeX string
         @param pos Position after "frac"
         @param parent Parent node
+        @param end End of the range being parsed
         @return Position after the fraction
         """
         # Parse numerator
-        pos = self._skip_whitespace(latex, pos)
-        if pos >= len(latex) or latex[pos] != "{":
+        pos = self._skip_whitespace(latex, pos, end)
+        if pos >= end or latex[pos] != "{":
             raise ParseError("Expected { after \\frac", pos, latex)
         
-        num_end = self._find_matching_brace(latex, pos)
-        num_content = latex[pos + 1:num_end]
+        num_start = pos + 1
+        num_end = self._find_matching_brace(latex, pos, end)
         
         # Parse denominator
-        pos = self._skip_whitespace(latex, num_end + 1)
-        if pos >= len(latex) or latex[pos] != "{":
+        pos = self._skip_whitespace(latex, num_end + 1, end)
+        if pos >= end or latex[pos] != "{":
             raise ParseError("Expected { for denominator", pos, latex)
         
-        denom_end = self._find_matching_brace(latex, pos)
-        denom_content = latex[pos + 1:denom_end]
+        denom_start = pos + 1
+        denom_end = self._find_matching_brace(latex, pos, end)
         
         # Create fraction node
         frac = SemanticNode(NodeType.FRACTION)
         
         num_node = SemanticNode(NodeType.GROUP, metadata={"role": "numerator"})
-        self._parse_latex_tokens(num_content, num_node)
+        self._parse_latex_tokens(latex, num_node, num_start, num_end)
         frac.add_child(num_node)
         
         denom_node = SemanticNode(NodeType.GROUP, metadata={"role": "denominator"})
-        self._parse_latex_tokens(denom_content, denom_node)
+        self._parse_latex_tokens(latex, denom_node, denom_start, denom_end)
         frac.add_child(denom_node)
         
         parent.add_child(frac)
         return denom_end + 1
     
-    def _parse_sqrt(self, latex: str, pos: int, parent: SemanticNode) -> int:
+    def _parse_sqrt(
+        self, latex: str, pos: int, parent: SemanticNode, end: int
+    ) -> int:
         """!
         @brief Parse a \\sqrt{...} or \\sqrt[n]{...} command.
         
         @param latex Full LaTeX string
         @param pos Position after "sqrt"
         @param parent Parent node
+        @param end End of the range being parsed
         @return Position after the sqrt
         """
-        pos = self._skip_whitespace(latex, pos)
+        pos = self._skip_whitespace(latex, pos, end)
         
         # Check for optional n-th root argument
-        index_content = None
-        if pos < len(latex) and latex[pos] == "[":
-            bracket_end = latex.find("]", pos)
+        index_start = index_end = pos
+        if pos < end and latex[pos] == "[":
+            bracket_end = latex.find("]", pos, end)
             if bracket_end == -1:
                 raise ParseError("Unclosed [ in sqrt", pos, latex)
-            index_content = latex[pos + 1:bracket_end]
+            index_start = pos + 1
+            index_end = bracket_end
             pos = bracket_end + 1
-            pos = self._skip_whitespace(latex, pos)
+            pos = self._skip_whitespace(latex, pos, end)
         
         # Parse radicand
-        if pos >= len(latex) or latex[pos] != "{":
+        if pos >= end or latex[pos] != "{":
             raise ParseError("Expected { after \\sqrt", pos, latex)
         
-        brace_end = self._find_matching_brace(latex, pos)
-        radicand_content = latex[pos + 1:brace_end]
+        radicand_start = pos + 1
+        brace_end = self._find_matching_brace(latex, pos, end)
         
         # Create sqrt node
-        if index_content:
+        if index_start < index_end:
             sqrt = SemanticNode(NodeType.NROOT)
             index_node = SemanticNode(NodeType.GROUP, metadata={"role": "index"})
-            self._parse_latex_tokens(index_content, index_node)
+            self._parse_latex_tokens(latex, index_node, index_start, index_end)
             sqrt.add_child(index_node)
         else:
             sqrt = SemanticNode(NodeType.SQRT)
         
         radicand = SemanticNode(NodeType.GROUP, metadata={"role": "radicand"})
-        self._parse_latex_tokens(radicand_content, radicand)
+        self._parse_latex_tokens(latex, radicand, radicand_start, brace_end)
         sqrt.add_child(radicand)
         
         parent.add_child(sqrt)
         return brace_end + 1
     
-    def _parse_latex_super(self, latex: str, pos: int, parent: SemanticNode) -> int:
+    def _parse_latex_super(
+        self, latex: str, pos: int, parent: SemanticNode, end: int
+    ) -> int:
         """!
         @brief Parse superscript (^).
         
         @param latex Full LaTeX string
         @param pos Position of ^
         @param parent Parent node
+        @param end End of the range being parsed
         @return Position after superscript
         """
         pos += 1  # Skip ^
@@ -389,33 +414,37 @@ class MathParser:
         base = parent.children.pop()
         
         # Parse the exponent
-        if pos < len(latex) and latex[pos] == "{":
-            brace_end = self._find_matching_brace(latex, pos)
-            exp_content = latex[pos + 1:brace_end]
-            pos = brace_end + 1
+        if pos < end and latex[pos] == "{":
+            exp_start = pos + 1
+            exp_end = self._find_matching_brace(latex, pos, end)
+            pos = exp_end + 1
         else:
             # Single character exponent
-            exp_content = latex[pos] if pos < len(latex) else ""
+            exp_start = pos
             pos += 1
+            exp_end = min(pos, end)
         
         # Create superscript node
         sup = SemanticNode(NodeType.SUPERSCRIPT)
         sup.add_child(base)
         
         exp = SemanticNode(NodeType.GROUP, metadata={"role": "exponent"})
-        self._parse_latex_tokens(exp_content, exp)
+        self._parse_latex_tokens(latex, exp, exp_start, exp_end)
         sup.add_child(exp)
         
         parent.add_child(sup)
         return pos
     
-    def _parse_latex_sub(self, latex: str, pos: int, parent: SemanticNode) -> int:
+    def _parse_latex_sub(
+        self, latex: str, pos: int, parent: SemanticNode, end: int
+    ) -> int:
         """!
         @brief Parse subscript (_).
         
         @param latex Full LaTeX string  
         @param pos Position of _
         @param parent Parent node
+        @param end End of the range being parsed
         @return Position after subscript
         """
         pos += 1  # Skip _
@@ -427,67 +456,77 @@ class MathParser:
         base = parent.children.pop()
         
         # Parse the subscript
-        if pos < len(latex) and latex[pos] == "{":
-            brace_end = self._find_matching_brace(latex, pos)
-            sub_content = latex[pos + 1:brace_end]
-            pos = brace_end + 1
+        if pos < end and latex[pos] == "{":
+            sub_start = pos + 1
+            sub_end = self._find_matching_brace(latex, pos, end)
+            pos = sub_end + 1
         else:
             # Single character subscript
-            sub_content = latex[pos] if pos < len(latex) else ""
+            sub_start = pos
             pos += 1
+            sub_end = min(pos, end)
         
         # Create subscript node
         sub_node = SemanticNode(NodeType.SUBSCRIPT)
         sub_node.add_child(base)
         
         sub_val = SemanticNode(NodeType.GROUP, metadata={"role": "subscript"})
-        self._parse_latex_tokens(sub_content, sub_val)
+        self._parse_latex_tokens(latex, sub_val, sub_start, sub_end)
         sub_node.add_child(sub_val)
         
         parent.add_child(sub_node)
         return pos
     
-    def _find_matching_brace(self, latex: str, pos: int) -> int:
+    def _find_matching_brace(self, latex: str, pos: int, end: int) -> int:
         """!
         @brief Find the matching closing brace for an opening brace.
         
         @param latex Full LaTeX string
         @param pos Position of opening brace
+        @param end End of the range the brace must close within
         @return Position of matching closing brace
         @throws ParseError If no matching brace found
         """
+        # Jump between braces with str.find instead of stepping through
+        # every character in Python
         depth = 1
         pos += 1
-        while pos < len(latex) and depth > 0:
-            if latex[pos] == "{":
+        find = latex.find
+        while True:
+            close = find("}", pos, end)
+            if close == -1:
+                raise ParseError("Unclosed brace", end, latex)
+            
+            # Account for every opening brace before this closing one
+            opening = find("{", pos, close)
+            while opening != -1:
                 depth += 1
-            elif latex[pos] == "}":
-                depth -= 1
-            pos += 1
-        
-        if depth != 0:
-            raise ParseError("Unclosed brace", pos, latex)
-        
-        return pos - 1
+                opening = find("{", opening + 1, close)
+            
+            depth -= 1
+            if depth == 0:
+                return close
+            pos = close + 1
     
-    def _skip_whitespace(self, latex: str, pos: int) -> int:
-        """Skip whitespace characters."""
-        while pos < len(latex) and latex[pos].isspace():
+    def _skip_whitespace(self, latex: str, pos: int, end: int) -> int:
+        """Skip whitespace characters before end."""
+        while pos < end and latex[pos].isspace():
             pos += 1
         return pos
     
-    def _parse_number(self, latex: str, pos: int) -> tuple[str, int]:
+    def _parse_number(self, latex: str, pos: int, end: int) -> tuple[str, int]:
         """!
         @brief Parse a number (integer or decimal).
         
         @param latex Full LaTeX string
         @param pos Starting position
+        @param end End of the range being parsed
         @return Tuple of (number string, end position)
         """
         start = pos
         has_decimal = False
         
-        while pos < len(latex):
+        while pos < end:
             char = latex[pos]
             if char.isdigit():
                 pos += 1
@@ -588,24 +627,24 @@ class MathParser:
         elif tag == "mi":
             # Identifier
             text = (elem.text or "").strip()
-            parent.add_child(SemanticNode(NodeType.IDENTIFIER, content=text))
+            parent.add_child(SemanticNode.leaf(NodeType.IDENTIFIER, text))
         
         elif tag == "mn":
             # Number
             text = (elem.text or "").strip()
-            parent.add_child(SemanticNode(NodeType.NUMBER, content=text))
+            parent.add_child(SemanticNode.leaf(NodeType.NUMBER, text))
         
         elif tag == "mo":
             # Operator
             text = (elem.text or "").strip()
             if text in "=<>≤≥≠":
-                parent.add_child(SemanticNode(NodeType.RELATION, content=text))
+                parent.add_child(SemanticNode.leaf(NodeType.RELATION, text))
             else:
-                parent.add_child(SemanticNode(NodeType.OPERATOR, content=text))
+                parent.add_child(SemanticNode.leaf(NodeType.OPERATOR, text))
         
         elif tag == "mtext":
             text = (elem.text or "").strip()
-            parent.add_child(SemanticNode(NodeType.TEXT, content=text))
+            parent.add_child(SemanticNode.leaf(NodeType.TEXT, text))
         
         else:
             # Unknown element - try to parse children
@@ -13,7 +13,7 @@ for converting semantic representations to speech text, Braille, etc.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Mapping
 
 from accessible_math_reader.core.semantic import SemanticNode, NodeType
 
@@ -21,6 +21,102 @@ if TYPE_CHECKING:
     from accessible_math_reader.config import Config
 
 
+## Layout token meaning "all children, in order" (see render_layout)
+ALL_CHILDREN = slice(None)
+
+
+def compile_layouts(layouts: Mapping[NodeType, tuple]) -> dict[NodeType, tuple]:
+    """!
+    @brief Prepare node layouts for render_layout().
+    
+    @details
+    Layouts are written in output order for readability; render_layout()
+    pushes them onto a stack, so they are stored reversed once here
+    instead of being reversed for every node rendered.
+    
+    @param layouts Mapping of node types to layouts in output order
+    @return Mapping of node types to compiled (reversed) layouts
+    """
+    return {node_type: layout[::-1] for node_type, layout in layouts.items()}
+
+
+def render_layout(
+    node: SemanticNode,
+    layouts: Mapping[NodeType, tuple],
+    leaf_renderers: Mapping[NodeType, Callable[[SemanticNode], str]],
+    fallback: Callable[[SemanticNode], str],
+    separator: str = "",
+) -> str:
+    """!
+    @brief Render a subtree iteratively into a single output buffer.
+    
+    @details
+    Composite node types are described by a layout: a tuple of literal
+    strings, child indices and ALL_CHILDREN, prepared with
+    compile_layouts(). Layouts are expanded onto an explicit stack so
+    pieces pop off in output order; child indices that are out of range
+    are skipped. Leaf node types are rendered
+    by their leaf renderer. Types with neither use @p fallback when they
+    carry content and otherwise render all of their children.
+    
+    Every piece is appended to one list that is joined once at the end,
+    so no intermediate strings are built and deep trees do not recurse.
+    With a @p separator, empty pieces are dropped and the rest are
+    joined with it, which gives the same text as joining the non-empty
+    parts of every node separately.
+    
+    @param node Root of the subtree to render
+    @param layouts Mapping of composite node types to compiled layouts
+    @param leaf_renderers Mapping of leaf node types to render functions
+    @param fallback Renderer for unknown node types that have content
+    @param separator String placed between non-empty pieces
+    @return Rendered string
+    """
+    out: list[str] = []
+    emit = out.append
+    stack: list = [node]
+    push = stack.append
+    pop = stack.pop
+    extend = stack.extend
+    get_leaf = leaf_renderers.get
+    get_layout = layouts.get
+    all_children = ALL_CHILDREN
+    str_type = str
+    
+    while stack:
+        item = pop()
+        if type(item) is str_type:
+            emit(item)
+            continue
+        
+        node_type = item.node_type
+        leaf = get_leaf(node_type)
+        if leaf is not None:
+            emit(leaf(item))
+            continue
+        
+        layout = get_layout(node_type)
+        if layout is None:
+            if item.content:
+                emit(fallback(item))
+                continue
+            layout = (all_children,)
+        
+        children = item.children
+        n_children = len(children)
+        for part in layout:
+            if type(part) is str_type:
+                push(part)
+            elif part is all_children:
+                extend(reversed(children))
+            elif part < n_children:
+                push(children[part])
+    
+    if separator:
+        return separator.join(filter(None, out))
+    return "".join(out)
+
+
 class BaseRenderer(ABC):
     """!
     @brief Abstract base class for math renderers.
@@ -30,6 +126,8 @@ class BaseRenderer(ABC):
     Subclasses implement format-specific rendering logic.
     """
     
+    __slots__ = ("config",)
+    
     def __init__(self, config: Config | None = None) -> None:
         """!
         @brief Initialize renderer with configuration.
@@ -51,6 +149,21 @@ class BaseRenderer(ABC):
         """
         pass
     
+    def render_bytes(self, node: SemanticNode, encoding: str = "utf-8") -> bytes:
+        """!
+        @brief Render a semantic node straight to encoded bytes.
+        
+        @details
+        Convenience entry point for byte sinks such as BRF files or
+        binary streams: the rendered string is encoded exactly once,
+        so callers do not need an extra text-mode wrapper.
+        
+        @param node The semantic node to render
+        @param encoding Output encoding
+        @return Encoded rendered output
+        """
+        return self.render(node).encode(encoding)
+    
     def render_children(self, node: SemanticNode, separator: str = " ") -> str:
         """!
         @brief Render all children of a node with a separator.
@@ -59,7 +172,44 @@ class BaseRenderer(ABC):
         @param separator String between rendered children
         @return Combined rendered string
         """
-        return separator.join(self.render(child) for child in node.children)
+        return separator.join(map(self.render, node.children))
+
+
+## Braille converter classes by notation, imported on first use (the
+## braille and speech modules import this one, so they cannot be
+## imported at module scope here)
+_braille_converter_classes: dict[str, type] = {}
+
+
+def _braille_converter_class(notation: str) -> type:
+    """Return the converter class for a notation, importing it once."""
+    key = "nemeth" if notation == "nemeth" else "ueb"
+    converter_class = _braille_converter_classes.get(key)
+    if converter_class is None:
+        if key == "nemeth":
+            from accessible_math_reader.braille.nemeth import NemethConverter
+            converter_class = NemethConverter
+        else:
+            from accessible_math_reader.braille.ueb import UEBConverter
+            converter_class = UEBConverter
+        _braille_converter_classes[key] = converter_class
+    return converter_class
+
+
+## Node types rendered as their content by to_simple_text()
+_SIMPLE_LEAF_TYPES = frozenset({
+    NodeType.NUMBER, NodeType.IDENTIFIER, NodeType.OPERATOR,
+    NodeType.RELATION, NodeType.TEXT, NodeType.FUNCTION,
+})
+
+## to_simple_text() layouts (see render_layout). Node types with neither
+## a layout nor leaf content join their children with spaces.
+_SIMPLE_LAYOUTS = compile_layouts({
+    NodeType.FRACTION: ("(", 0, ")/(", 1, ")"),
+    NodeType.SUPERSCRIPT: (0, "^", 1),
+    NodeType.SUBSCRIPT: (0, "_", 1),
+    NodeType.SQRT: ("√(", 0, ")"),
+})
 
 
 class MathRenderer:
@@ -95,9 +245,10 @@ class MathRenderer:
             config = Config()
         self.config = config
         
-        # Lazy-load renderers
+        # Lazy-load renderers; Braille converters are kept per class so
+        # both notations reuse their instances and subtree caches
         self._speech_renderer = None
-        self._braille_renderer = None
+        self._braille_renderers: dict[type, BaseRenderer] = {}
     
     def to_speech(self, node: SemanticNode) -> str:
         """!
@@ -106,9 +257,8 @@ class MathRenderer:
         @param node Root of semantic tree
         @return Spoken text representation
         """
-        from accessible_math_reader.speech.rules import SpeechRenderer
-        
         if self._speech_renderer is None:
+            from accessible_math_reader.speech.rules import SpeechRenderer
             self._speech_renderer = SpeechRenderer(self.config)
         
         return self._speech_renderer.render(node)
@@ -121,13 +271,10 @@ class MathRenderer:
         @param notation Braille notation ("nemeth" or "ueb")
         @return Braille string
         """
-        if notation == "nemeth":
-            from accessible_math_reader.braille.nemeth import NemethConverter
-            converter = NemethConverter(self.config)
-        else:
-            from accessible_math_reader.braille.ueb import UEBConverter
-            converter = UEBConverter(self.config)
-        
+        converter_class = _braille_converter_class(notation)
+        converter = self._braille_renderers.get(converter_class)
+        if converter is None:
+            converter = self._braille_renderers[converter_class] = converter_class(self.config)
         return converter.render(node)
     
     def to_simple_text(self, node: SemanticNode) -> str:
@@ -140,37 +287,61 @@ class MathRenderer:
         return self._render_simple(node)
     
     def _render_simple(self, node: SemanticNode) -> str:
-        """Recursive simple text rendering."""
-        if node.node_type == NodeType.ROOT:
-            return " ".join(self._render_simple(c) for c in node.children)
-        
-        elif node.node_type == NodeType.GROUP:
-            content = " ".join(self._render_simple(c) for c in node.children)
-            return f"({content})" if len(node.children) > 1 else content
-        
-        elif node.node_type == NodeType.FRACTION:
-            num = self._render_simple(node.children[0]) if node.children else ""
-            denom = self._render_simple(node.children[1]) if len(node.children) > 1 else ""
-            return f"({num})/({denom})"
-        
-        elif node.node_type == NodeType.SUPERSCRIPT:
-            base = self._render_simple(node.children[0]) if node.children else ""
-            exp = self._render_simple(node.children[1]) if len(node.children) > 1 else ""
-            return f"{base}^{exp}"
-        
-        elif node.node_type == NodeType.SUBSCRIPT:
-            base = self._render_simple(node.children[0]) if node.children else ""
-            sub = self._render_simple(node.children[1]) if len(node.children) > 1 else ""
-            return f"{base}_{sub}"
-        
-        elif node.node_type == NodeType.SQRT:
-            radicand = self._render_simple(node.children[0]) if node.children else ""
-            return f"√({radicand})"
-        
-        elif node.node_type in (NodeType.NUMBER, NodeType.IDENTIFIER, 
-                                NodeType.OPERATOR, NodeType.RELATION,
-                                NodeType.TEXT, NodeType.FUNCTION):
-            return node.content
+        """!
+        @brief Simple text rendering into a single output buffer.
         
-        else:
-            return " ".join(self._render_simple(c) for c in node.children)
+        @details
+        Works like render_layout(): nodes are expanded on an explicit
+        stack into literal tokens and child nodes, so every piece is
+        appended to one list and joined once, without building an
+        intermediate string per node or recursing. Composite types use
+        _SIMPLE_LAYOUTS; all others emit their children separated by
+        spaces, in parentheses for a GROUP of more than one child.
+        
+        @param node Root of the subtree to render
+        @return Simple text representation
+        """
+        out: list[str] = []
+        emit = out.append
+        stack: list = [node]
+        push = stack.append
+        pop = stack.pop
+        leaf_types = _SIMPLE_LEAF_TYPES
+        get_layout = _SIMPLE_LAYOUTS.get
+        group = NodeType.GROUP
+        str_type = str
+        
+        while stack:
+            item = pop()
+            if type(item) is str_type:
+                emit(item)
+                continue
+            
+            node_type = item.node_type
+            if node_type in leaf_types:
+                emit(item.content)
+                continue
+            
+            children = item.children
+            n_children = len(children)
+            layout = get_layout(node_type)
+            if layout is not None:
+                for part in layout:
+                    if type(part) is str_type:
+                        push(part)
+                    elif part < n_children:
+                        push(children[part])
+                continue
+            
+            # Pushed in reverse so the pieces pop in output order
+            grouped = node_type is group and n_children > 1
+            if grouped:
+                push(")")
+            for i in range(n_children - 1, -1, -1):
+                push(children[i])
+                if i:
+                    push(" ")
+            if grouped:
+                push("(")
+        
+        return "".join(out)
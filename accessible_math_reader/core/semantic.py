@@ -15,20 +15,32 @@ in a format-agnostic way. This intermediate representation enables:
 
 from __future__ import annotations
 
-import uuid
-from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import Optional, Iterator, Any
+import itertools
+import json
+import random
+from dataclasses import InitVar, dataclass, field
+from enum import Enum, IntEnum, auto
+from typing import Optional, Iterator, Any, TextIO
 
+from accessible_math_reader._compat import _DATACLASS_SLOTS
 
-class NodeType(Enum):
+
+class NodeType(IntEnum):
     """!
     @brief Types of mathematical semantic nodes.
     
     @details
     Each node type represents a distinct mathematical concept that
     may require specific handling for speech or Braille output.
+    
+    Members are ints so that the per-node dict lookups keyed by node
+    type (renderer dispatch, layouts, description tables) use the C
+    int hash rather than Enum's Python-level __hash__. str() and
+    format() keep the plain Enum output ("NodeType.ROOT").
     """
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
+    
     # Structural
     ROOT = auto()           ##< Root of the expression tree
     GROUP = auto()          ##< Grouping (parentheses, brackets)
@@ -66,7 +78,37 @@ class NodeType(Enum):
     SPACE = auto()          ##< Whitespace
 
 
-@dataclass
+# Source of auto-generated node IDs: unique within a process, and randomly
+# seeded so that IDs from separate processes are unlikely to collide.
+# A counter step is several times cheaper than a uuid4() per node.
+_node_id_counter = itertools.count(random.getrandbits(32))
+
+
+def _next_node_id() -> str:
+    """Return a fresh "math-node-xxxxxxxx" identifier."""
+    return f"math-node-{next(_node_id_counter) & 0xFFFFFFFF:08x}"
+
+
+# Instance allocation without __init__ (see SemanticNode.leaf)
+_new_object = object.__new__
+
+# Node types that navigation flattens into their parent's children
+_FLATTENED_TYPES = frozenset({NodeType.GROUP, NodeType.ROOT})
+
+# Serialized name per node type (Enum.name is a Python-level property)
+_NODE_TYPE_NAMES = {node_type: node_type.name for node_type in NodeType}
+
+# JSON opening of each node's object in write_json(), up to its content
+_NODE_JSON_HEADS = {
+    node_type: f'{{"type": {json.dumps(name)}, "content": '
+    for node_type, name in _NODE_TYPE_NAMES.items()
+}
+
+# One-shot encoder (C accelerated) for field values in write_json()
+_json_encode = json.JSONEncoder().encode
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class SemanticNode:
     """!
     @brief A node in the mathematical expression tree.
@@ -92,12 +134,20 @@ class SemanticNode:
         print(child.content)
     @endcode
     
+    @section node_edits Editing Trees
+    Nodes memoize their depth and navigable children. add_child() keeps
+    them up to date. After reparenting nodes or editing a children list
+    directly, call invalidate_caches() on the edited node or any
+    ancestor. Rendered output is never memoized on the node, so edits
+    to content or children are always seen by the renderers.
+    
     @param node_type The type of mathematical construct
     @param content Text content for leaf nodes (numbers, identifiers)
     @param children Child nodes (e.g., numerator/denominator for fractions)
     @param parent Reference to parent node (set automatically)
     @param metadata Additional data (e.g., original LaTeX, position info)
-    @param node_id Unique stable identifier for ARIA and navigation (auto-generated)
+    @param node_id Unique stable identifier for ARIA and navigation
+                   (generated on first read if not given)
     @param accessibility_metadata Structured metadata for screen readers and ARIA
     """
     node_type: NodeType
@@ -108,19 +158,127 @@ class SemanticNode:
     
     # === ACCESSIBILITY ENHANCEMENTS ===
     # Stable unique ID for ARIA relationships and DOM manipulation
-    # This ID persists across re-renders to maintain focus and state
-    node_id: str = field(default_factory=lambda: f"math-node-{uuid.uuid4().hex[:8]}")
+    # This ID persists across re-renders to maintain focus and state.
+    # Only the constructor argument is declared here; the node_id
+    # property (installed after the class) generates it on first read.
+    node_id: InitVar[Optional[str]] = None
     
     # Accessibility metadata for screen reader integration
     # Contains: spoken_text, aria_role, aria_label, description, navigation_hint
     accessibility_metadata: dict[str, Any] = field(default_factory=dict)
     
-    def __post_init__(self) -> None:
+    # Memoized ARIA attribute markup and the inputs it was built from
+    # (see aria_renderer._node_markup)
+    _aria_attr_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Storage behind the node_id property; None until first read
+    _node_id: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Memoized depth in the tree (see depth); -1 when not known
+    _depth: int = field(default=-1, init=False, repr=False, compare=False)
+    
+    # Memoized navigable children (see get_navigable_children)
+    _navigable_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self, node_id: Optional[str]) -> None:
         """!
         @brief Set parent references for all children after initialization.
+        
+        @param node_id Explicit node ID, or None to generate one lazily
+        """
+        children = self.children
+        if children:
+            for child in children:
+                if child._depth >= 0:
+                    child._forget_depths()
+                child.parent = self
+        if node_id is not None:
+            self._node_id = node_id
+    
+    def _get_node_id(self) -> str:
+        """!
+        @brief Get the node ID, generating it on first read.
+        
+        @details
+        Most parsed nodes are spoken or brailled and never rendered to
+        ARIA or serialized, so they never pay for formatting an ID.
+        
+        @return Unique node ID
         """
-        for child in self.children:
-            child.parent = self
+        node_id = self._node_id
+        if node_id is None:
+            node_id = self._node_id = _next_node_id()
+        return node_id
+    
+    def _set_node_id(self, node_id: str) -> None:
+        """Replace the node ID (e.g. with a deterministic one)."""
+        self._node_id = node_id
+    
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        """!
+        @brief Support pickling and copying with stable node IDs.
+        
+        @details
+        Generates the node ID before the node's state is captured, so a
+        pickled or copied tree keeps the IDs of the original (and
+        compares equal to it) even if none had been read yet.
+        
+        @param protocol Pickle protocol version
+        @return Reduction tuple from object.__reduce_ex__()
+        """
+        self._get_node_id()
+        return object.__reduce_ex__(self, protocol)
+    
+    def __eq__(self, other: object) -> bool:
+        """!
+        @brief Compare two nodes field by field.
+        
+        @details
+        Matches the generated dataclass comparison, reading node_id
+        through its property so that IDs not yet generated are created
+        and compared like any other.
+        
+        @param other Object to compare with
+        @return True if all fields, including node IDs, are equal
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.node_type, self.content, self.children, self.parent,
+            self.metadata, self.node_id, self.accessibility_metadata,
+        ) == (
+            other.node_type, other.content, other.children, other.parent,
+            other.metadata, other.node_id, other.accessibility_metadata,
+        )
+    
+    @classmethod
+    def leaf(cls, node_type: NodeType, content: str = "") -> SemanticNode:
+        """!
+        @brief Create a childless node with default metadata.
+        
+        @details
+        Equivalent to SemanticNode(node_type, content=content), but
+        assigns the fields directly instead of going through the
+        generated __init__ and __post_init__, which have nothing to do
+        for a leaf. The parser creates most nodes this way. Every field
+        must be assigned here, so keep it in step with the field list.
+        
+        @param node_type The type of mathematical construct
+        @param content Text content of the leaf
+        @return New SemanticNode with no children and no parent
+        """
+        node = _new_object(cls)
+        node.node_type = node_type
+        node.content = content
+        node.children = []
+        node.parent = None
+        node.metadata = {}
+        node.accessibility_metadata = {}
+        node._aria_attr_cache = None
+        node._node_id = None
+        node._depth = -1
+        node._navigable_cache = None
+        return node
     
     def add_child(self, child: SemanticNode) -> None:
         """!
@@ -128,8 +286,40 @@ class SemanticNode:
         
         @param child The child node to add
         """
+        if child._depth >= 0:
+            child._forget_depths()
         child.parent = self
         self.children.append(child)
+        
+        # Navigable children change for this node and each ancestor that
+        # flattens this node's children into its own
+        node: Optional[SemanticNode] = self
+        while node is not None:
+            node._navigable_cache = None
+            if node.node_type not in _FLATTENED_TYPES:
+                break
+            node = node.parent
+    
+    def invalidate_caches(self) -> None:
+        """!
+        @brief Forget memoized data after editing the tree directly.
+        
+        @details
+        add_child() keeps memoized data up to date by itself. After
+        assigning node_type, children or parent, or editing a children
+        list in place, call this on the edited node or any of its
+        ancestors (e.g. the root). It clears the depths and navigable
+        children of the whole subtree, and the navigable children of the
+        node's ancestors, which depend on it.
+        """
+        for node in self.walk():
+            node._depth = -1
+            node._navigable_cache = None
+        
+        node = self.parent
+        while node is not None:
+            node._navigable_cache = None
+            node = node.parent
     
     def __iter__(self) -> Iterator[SemanticNode]:
         """!
@@ -165,19 +355,75 @@ class SemanticNode:
         """
         return len(self.children) == 0
     
+    @property
+    def cache_key(self) -> tuple:
+        """!
+        @brief Get a hashable key describing this subtree.
+        
+        @details
+        The key is built from the node type, content and the keys of all
+        children, so structurally identical subtrees share the same key
+        and render to the same output. It is rebuilt from the current tree
+        on every read (O(N)) rather than stored on the node, so it is
+        never stale after the tree is edited; read it once per operation.
+        
+        @return Tuple of (node_type, content, child keys)
+        """
+        # Build keys bottom-up by visiting the nodes in reverse pre-order,
+        # which never recurses: each node's children have been visited just
+        # before it, so their keys are the top entries of keys, last child
+        # deepest
+        keys: list[tuple] = []
+        append = keys.append
+        for node in reversed(list(self.walk())):
+            children = node.children
+            if children:
+                n = len(children)
+                child_keys = tuple(keys[:-n - 1:-1])
+                del keys[-n:]
+                append((node.node_type, node.content, child_keys))
+            else:
+                append((node.node_type, node.content, ()))
+        return keys[0]
+    
     @property
     def depth(self) -> int:
         """!
         @brief Calculate the depth of this node in the tree.
         
+        @details
+        Walks parent references only up to the nearest node whose depth
+        is already known, then stores the depth on every node passed, so
+        depth queries over a whole tree cost O(N) rather than O(N * h).
+        Known depths are always closed under ancestors; add_child()
+        forgets them for a subtree that gets a new parent. A parent
+        assigned directly is not seen until invalidate_caches() is called.
+        
         @return Depth (0 for root)
         """
-        d = 0
-        node = self
-        while node.parent is not None:
-            d += 1
+        if self._depth >= 0:
+            return self._depth
+        
+        path = []
+        node: Optional[SemanticNode] = self
+        while node is not None and node._depth < 0:
+            path.append(node)
             node = node.parent
-        return d
+        
+        d = node._depth + 1 if node is not None else 0
+        for node in reversed(path):
+            node._depth = d
+            d += 1
+        return self._depth
+    
+    def _forget_depths(self) -> None:
+        """Clear the memoized depths of this subtree (see depth)."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._depth >= 0:
+                node._depth = -1
+                stack.extend(node.children)
     
     def walk(self) -> Iterator[SemanticNode]:
         """!
@@ -185,13 +431,22 @@ class SemanticNode:
         
         @details
         Yields each node in the subtree rooted at this node,
-        in pre-order (parent before children).
+        in pre-order (parent before children). A single generator
+        works through an explicit stack, so nested subtrees do not each
+        add a generator frame and deep trees do not hit the recursion
+        limit.
         
         @return Iterator over all nodes in subtree
         """
-        yield self
-        for child in self.children:
-            yield from child.walk()
+        stack = [self]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node = pop()
+            yield node
+            children = node.children
+            if children:
+                extend(reversed(children))
     
     def walk_leaves(self) -> Iterator[SemanticNode]:
         """!
@@ -211,16 +466,30 @@ class SemanticNode:
         Some node types (like GROUP) may not be meaningful navigation
         targets themselves, so this filters to significant children.
         
+        The flattened result is computed iteratively once and memoized
+        on the node; add_child() invalidates it for the node and the
+        ancestors that flatten it (after direct edits of children lists,
+        call invalidate_caches()). Each call returns a new list.
+        
         @return List of navigable child nodes
         """
-        navigable = []
-        for child in self.children:
-            if child.node_type in (NodeType.GROUP, NodeType.ROOT):
-                # Flatten groups - navigate their children directly
-                navigable.extend(child.get_navigable_children())
-            else:
-                navigable.append(child)
-        return navigable
+        return list(self._navigable_children())
+    
+    def _navigable_children(self) -> tuple[SemanticNode, ...]:
+        """Return the memoized navigable children (see get_navigable_children)."""
+        cached = self._navigable_cache
+        if cached is None:
+            navigable = []
+            stack = self.children[::-1]
+            while stack:
+                child = stack.pop()
+                if child.node_type in _FLATTENED_TYPES:
+                    # Flatten groups - navigate their children directly
+                    stack.extend(reversed(child.children))
+                else:
+                    navigable.append(child)
+            cached = self._navigable_cache = tuple(navigable)
+        return cached
     
     def to_dict(self) -> dict:
         """!
@@ -230,17 +499,83 @@ class SemanticNode:
         Includes accessibility metadata for screen reader integration
         and ARIA attribute generation.
         
+        The dictionaries are built top-down with an explicit stack, so
+        deep trees do not hit the recursion limit: each stack entry
+        pairs a node with the "children" list of its parent's dictionary,
+        and nodes pop in pre-order, so siblings are appended in order.
+        
+        The metadata dictionaries are copied, so editing the result never
+        reaches back into the tree.
+        
         @return Dictionary representation of the node tree
         """
-        return {
-            "type": self.node_type.name,
-            "content": self.content,
-            "children": [child.to_dict() for child in self.children],
-            "metadata": self.metadata,
-            # Accessibility enhancements for screen readers
-            "node_id": self.node_id,
-            "accessibility": self.accessibility_metadata,
-        }
+        type_names = _NODE_TYPE_NAMES
+        root: list[dict] = []
+        stack = [(self, root)]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node, siblings = pop()
+            child_dicts: list[dict] = []
+            siblings.append({
+                "type": type_names[node.node_type],
+                "content": node.content,
+                "children": child_dicts,
+                "metadata": dict(node.metadata),
+                # Accessibility enhancements for screen readers
+                "node_id": node.node_id,
+                "accessibility": dict(node.accessibility_metadata),
+            })
+            children = node.children
+            if children:
+                extend([(child, child_dicts) for child in reversed(children)])
+        return root[0]
+    
+    def write_json(self, fp: TextIO) -> None:
+        """!
+        @brief Write the node tree to a text stream as JSON.
+        
+        @details
+        Writes the same document as json.dump(node.to_dict(), fp)
+        without building the intermediate dictionaries. The tree is
+        walked with an explicit stack holding either nodes still to be
+        opened or literal fragments waiting for a subtree to finish, and
+        each field is encoded by the json module's C encoder as it is
+        reached.
+        
+        @param fp Writable text stream
+        """
+        heads = _NODE_JSON_HEADS
+        encode = _json_encode
+        write = fp.write
+        stack: list = [self]
+        pop = stack.pop
+        push = stack.append
+        
+        while stack:
+            item = pop()
+            if type(item) is str:
+                write(item)
+                continue
+            
+            # Everything after the children is written once they are done
+            metadata = item.metadata
+            accessibility = item.accessibility_metadata
+            write(heads[item.node_type] + encode(item.content) + ', "children": [')
+            push(
+                '], "metadata": ' + (encode(metadata) if metadata else '{}')
+                + ', "node_id": ' + encode(item.node_id)
+                + ', "accessibility": ' + (encode(accessibility) if accessibility else '{}')
+                + '}'
+            )
+            
+            # Children, pushed in reverse so they pop in document order
+            children = item.children
+            for i in range(len(children) - 1, 0, -1):
+                push(children[i])
+                push(', ')
+            if children:
+                push(children[0])
     
     @classmethod
     def from_dict(cls, data: dict) -> SemanticNode:
@@ -275,27 +610,30 @@ class SemanticNode:
         
         @return Dictionary of ARIA attribute names and values
         """
+        metadata = self.accessibility_metadata
         attrs = {
             "id": self.node_id,
-            "role": self.accessibility_metadata.get("aria_role", "group"),
+            "role": metadata.get("aria_role", "group"),
         }
         
-        # Add aria-label if available
-        if "aria_label" in self.accessibility_metadata:
-            attrs["aria-label"] = self.accessibility_metadata["aria_label"]
-        
-        # Add aria-describedby if description exists
-        if "description" in self.accessibility_metadata:
-            attrs["aria-describedby"] = f"{self.node_id}-desc"
-        
-        # Add aria-roledescription for math-specific roles
-        if "aria_roledescription" in self.accessibility_metadata:
-            attrs["aria-roledescription"] = self.accessibility_metadata["aria_roledescription"]
+        # Metadata-driven attributes; parsed nodes usually carry none
+        if metadata:
+            # Add aria-label if available
+            if "aria_label" in metadata:
+                attrs["aria-label"] = metadata["aria_label"]
+            
+            # Add aria-describedby if description exists
+            if "description" in metadata:
+                attrs["aria-describedby"] = f"{self.node_id}-desc"
+            
+            # Add aria-roledescription for math-specific roles
+            if "aria_roledescription" in metadata:
+                attrs["aria-roledescription"] = metadata["aria_roledescription"]
         
         # Add aria-owns for parent-child relationships
-        if self.children:
-            child_ids = [child.node_id for child in self.children]
-            attrs["aria-owns"] = " ".join(child_ids)
+        children = self.children
+        if children:
+            attrs["aria-owns"] = " ".join([child.node_id for child in children])
         
         return attrs
     
@@ -336,6 +674,11 @@ class SemanticNode:
             self.accessibility_metadata["aria_roledescription"] = aria_roledescription
 
 
+# Installed after the dataclass is built, since during class creation the
+# name node_id belongs to the constructor argument
+SemanticNode.node_id = property(SemanticNode._get_node_id, SemanticNode._set_node_id)
+
+
 class MathNavigator:
     """!
     @brief Navigator for step-by-step exploration of math expressions.
@@ -361,6 +704,8 @@ class MathNavigator:
     @endcode
     """
     
+    __slots__ = ("_root", "_current", "_position_stack", "_sibling_index")
+    
     def __init__(self, root: SemanticNode) -> None:
         """!
         @brief Initialize navigator at the root of an expression.
@@ -387,13 +732,14 @@ class MathNavigator:
         
         @return True if successful, False if no children
         """
-        navigable = self._current.get_navigable_children()
+        navigable = self._current._navigable_children()
         if not navigable:
             return False
         
         self._position_stack.append(self._sibling_index)
         self._sibling_index = 0
         self._current = navigable[0]
+        self._on_move()
         return True
     
     def exit(self) -> bool:
@@ -407,6 +753,7 @@ class MathNavigator:
         
         self._current = self._current.parent
         self._sibling_index = self._position_stack.pop()
+        self._on_move()
         return True
     
     def next(self) -> bool:
@@ -418,12 +765,13 @@ class MathNavigator:
         if self._current.parent is None:
             return False
         
-        siblings = self._current.parent.get_navigable_children()
+        siblings = self._current.parent._navigable_children()
         if self._sibling_index >= len(siblings) - 1:
             return False
         
         self._sibling_index += 1
         self._current = siblings[self._sibling_index]
+        self._on_move()
         return True
     
     def previous(self) -> bool:
@@ -436,10 +784,20 @@ class MathNavigator:
             return False
         
         self._sibling_index -= 1
-        siblings = self._current.parent.get_navigable_children()
+        siblings = self._current.parent._navigable_children()
         self._current = siblings[self._sibling_index]
+        self._on_move()
         return True
     
+    def _on_move(self) -> None:
+        """!
+        @brief Hook called after enter/exit/next/previous moves the focus.
+        
+        @details
+        No-op here; subclasses override it to react to focus changes
+        instead of wrapping each movement method.
+        """
+    
     def reset(self) -> None:
         """!
         @brief Reset navigation to the root.
@@ -459,4 +817,5 @@ class MathNavigator:
         while node is not None:
             path.append(node)
             node = node.parent
-        return list(reversed(path))
+        path.reverse()
+        return path
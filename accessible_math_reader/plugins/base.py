@@ -20,10 +20,13 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, Optional
 import importlib.util
 import logging
+import os
 
+from accessible_math_reader._compat import _DATACLASS_SLOTS
 from accessible_math_reader.core.semantic import SemanticNode
 
 if TYPE_CHECKING:
@@ -42,7 +45,7 @@ class PluginType(Enum):
     LOCALIZATION = "localization"      ##< Language/locale support
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PluginInfo:
     """!
     @brief Metadata about a plugin.
@@ -223,6 +226,111 @@ class InputFormatPlugin(BasePlugin):
         pass
 
 
+def _scan_plugin_dir(
+    path: Path,
+    mtime: int,
+) -> tuple[int, tuple[tuple[str, int], ...], tuple[Path, ...]]:
+    """!
+    @brief Scan one plugin directory for plugin modules and packages.
+    
+    @param path Plugin directory
+    @param mtime Modification time of the directory, in nanoseconds
+    @return (directory mtime, (subdirectory, mtime) pairs, plugin paths)
+    """
+    # One scandir pass; DirEntry caches the file type, so modules cost no
+    # extra syscalls and only package candidates are stat()ed
+    modules = []
+    packages = []
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir():
+                # Every subdirectory's mtime is recorded, since adding an
+                # __init__.py to one does not touch the plugin directory
+                subdirs.append((entry.path, entry.stat().st_mtime_ns))
+                init_file = os.path.join(entry.path, "__init__.py")
+                if os.path.isfile(init_file):
+                    packages.append(Path(init_file))
+            elif name.endswith(".py") and name[0] != "_" and entry.is_file():
+                modules.append(Path(entry.path))
+    
+    # Modules first, then packages, as discovery has always listed them
+    found = modules + packages
+    
+    return mtime, tuple(subdirs), tuple(found)
+
+
+def _stamps_match(
+    mtime: int,
+    subdirs: tuple[tuple[str, int], ...],
+    current_mtime: int,
+) -> bool:
+    """Check a cached directory scan against the current modification times."""
+    if mtime != current_mtime:
+        return False
+    try:
+        return all(os.stat(subdir).st_mtime_ns == sub_mtime for subdir, sub_mtime in subdirs)
+    except OSError:
+        return False
+
+
+def _import_plugin_module(
+    path: Path,
+    force_reload: bool,
+) -> Optional[tuple[ModuleType, Optional[type[BasePlugin]]]]:
+    """!
+    @brief Execute a plugin module, or reuse the one executed earlier.
+    
+    @details
+    The module namespace is scanned for its plugin class once, when the
+    module is executed, and the class is cached with the module.
+    
+    @param path Path to plugin Python file
+    @param force_reload Execute the module even if it is cached
+    @return (module, plugin class or None), or None if the file cannot
+            hold a plugin or no loader handles it
+    """
+    cache = PluginManager._module_cache
+    key = os.path.abspath(path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = cache.get(key)
+    if cached is not None and cached[0] == mtime and not force_reload:
+        return cached[1]
+    
+    # A single-file plugin subclasses one of the *Plugin base classes, so
+    # its source must name one; other helper modules are never executed.
+    # Packages may re-export a class under any name and are always run.
+    if path.name != "__init__.py" and b"Plugin" not in path.read_bytes():
+        cache[key] = (mtime, None)
+        return None
+    
+    spec = importlib.util.spec_from_file_location(
+        path.stem, 
+        str(path)
+    )
+    if spec is None or spec.loader is None:
+        return None
+    
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    
+    # Find plugin classes in module
+    plugin_class = None
+    for name in dir(module):
+        obj = getattr(module, name)
+        if (isinstance(obj, type) and 
+            issubclass(obj, BasePlugin) and 
+            obj is not BasePlugin and
+            not name.startswith("_")):
+            plugin_class = obj
+            break
+    
+    entry = (module, plugin_class)
+    cache[key] = (mtime, entry)
+    return entry
+
+
 class PluginManager:
     """!
     @brief Manages plugin discovery, loading, and lifecycle.
@@ -248,6 +356,17 @@ class PluginManager:
     @endcode
     """
     
+    # Discovery results shared by every manager in the process, keyed by
+    # directory: (directory mtime, ((subdirectory, mtime), ...), plugin paths)
+    _discovery_cache: dict[str, tuple[int, tuple[tuple[str, int], ...], tuple[Path, ...]]] = {}
+    
+    # Executed plugin modules shared by every manager in the process,
+    # keyed by absolute file path: (file mtime, (module, plugin class)),
+    # or (file mtime, None) for files skipped without executing them
+    _module_cache: dict[
+        str, tuple[int, Optional[tuple[ModuleType, Optional[type[BasePlugin]]]]]
+    ] = {}
+    
     def __init__(self, config: Config) -> None:
         """!
         @brief Initialize plugin manager.
@@ -257,6 +376,14 @@ class PluginManager:
         self.config = config
         self._plugins: dict[str, BasePlugin] = {}
         self._discovered: list[Path] = []
+        
+        # Plugin created from each loaded file, with the module it came from
+        self._loaded_modules: dict[str, tuple[ModuleType, BasePlugin]] = {}
+        
+        # Lookups derived from the loaded plugins, built on first use
+        self._plugins_by_type: Optional[dict[PluginType, list[BasePlugin]]] = None
+        self._speech_rules: Optional[dict[str, Callable[[SemanticNode], str]]] = None
+        self._braille_notations: Optional[dict[str, BrailleNotationPlugin]] = None
     
     def discover_plugins(self) -> list[Path]:
         """!
@@ -264,79 +391,94 @@ class PluginManager:
         
         @details
         Scans plugin directories for Python files that might
-        contain plugin implementations.
+        contain plugin implementations. Each directory's result is
+        cached for the whole process and reused while the modification
+        times of the directory and its subdirectories are unchanged, so
+        repeated discovery costs a few stat() calls per directory.
         
         @return List of discovered plugin file paths
         """
         self._discovered = []
+        cache = PluginManager._discovery_cache
         
         for plugin_dir in self.config.plugin_dirs:
             path = Path(plugin_dir)
-            if not path.exists():
+            try:
+                mtime = path.stat().st_mtime_ns
+            except OSError:
                 logger.warning(f"Plugin directory not found: {plugin_dir}")
                 continue
             
-            # Find Python files
-            for py_file in path.glob("*.py"):
-                if not py_file.name.startswith("_"):
-                    self._discovered.append(py_file)
-            
-            # Find packages
-            for pkg_dir in path.iterdir():
-                if pkg_dir.is_dir() and (pkg_dir / "__init__.py").exists():
-                    self._discovered.append(pkg_dir / "__init__.py")
+            key = os.path.abspath(plugin_dir)
+            cached = cache.get(key)
+            if cached is None or not _stamps_match(cached[0], cached[1], mtime):
+                cached = _scan_plugin_dir(path, mtime)
+                cache[key] = cached
+            self._discovered.extend(cached[2])
         
         logger.info(f"Discovered {len(self._discovered)} potential plugins")
         return self._discovered
     
-    def load_plugin(self, path: Path) -> Optional[BasePlugin]:
+    @classmethod
+    def clear_discovery_cache(cls) -> None:
+        """!
+        @brief Forget all cached plugin directory scans.
+        """
+        cls._discovery_cache.clear()
+    
+    def load_plugin(self, path: Path, force_reload: bool = False) -> Optional[BasePlugin]:
         """!
         @brief Load a single plugin from a file path.
         
+        @details
+        Plugin modules are executed once per process and reused while
+        their file's modification time is unchanged, and a plugin this
+        manager already loaded from the same module is returned as is,
+        so repeated load_all() calls do not re-run module code or
+        re-initialize plugins.
+        
         @param path Path to plugin Python file
+        @param force_reload Re-execute the module and create a new plugin
+               instance even if a cached one is available
         @return Loaded plugin instance, or None if loading failed
         """
         try:
-            spec = importlib.util.spec_from_file_location(
-                path.stem, 
-                str(path)
-            )
-            if spec is None or spec.loader is None:
+            entry = _import_plugin_module(path, force_reload)
+            if entry is None:
                 return None
+            module, plugin_class = entry
             
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            key = str(path)
+            loaded = self._loaded_modules.get(key)
+            if loaded is not None and loaded[0] is module:
+                return loaded[1]
             
-            # Find plugin classes in module
-            for name in dir(module):
-                obj = getattr(module, name)
-                if (isinstance(obj, type) and 
-                    issubclass(obj, BasePlugin) and 
-                    obj is not BasePlugin and
-                    not name.startswith("_")):
-                    
-                    # Instantiate and initialize
-                    plugin = obj()
-                    plugin.initialize(self.config)
-                    self._plugins[plugin.info.name] = plugin
-                    logger.info(f"Loaded plugin: {plugin.info.name}")
-                    return plugin
+            if plugin_class is None:
+                return None
             
-            return None
+            # Instantiate and initialize
+            plugin = plugin_class()
+            plugin.initialize(self.config)
+            self._plugins[plugin.info.name] = plugin
+            self._loaded_modules[key] = (module, plugin)
+            self._invalidate_lookups()
+            logger.info(f"Loaded plugin: {plugin.info.name}")
+            return plugin
             
         except Exception as e:
             logger.error(f"Failed to load plugin from {path}: {e}")
             return None
     
-    def load_all(self) -> int:
+    def load_all(self, force_reload: bool = False) -> int:
         """!
         @brief Load all discovered plugins.
         
+        @param force_reload Re-execute every plugin module (see load_plugin())
         @return Number of successfully loaded plugins
         """
         count = 0
         for path in self._discovered:
-            if self.load_plugin(path):
+            if self.load_plugin(path, force_reload):
                 count += 1
         return count
     
@@ -353,37 +495,62 @@ class PluginManager:
         """!
         @brief Get all loaded plugins of a specific type.
         
+        @details
+        Plugins are grouped by type once per change to the loaded set.
+        
         @param plugin_type Type of plugins to retrieve
         @return List of plugins of that type
         """
-        return [
-            p for p in self._plugins.values()
-            if p.info.plugin_type == plugin_type
-        ]
+        by_type = self._plugins_by_type
+        if by_type is None:
+            by_type = {}
+            for p in self._plugins.values():
+                by_type.setdefault(p.info.plugin_type, []).append(p)
+            self._plugins_by_type = by_type
+        return list(by_type.get(plugin_type, ()))
     
     def get_speech_rules(self) -> dict[str, Callable[[SemanticNode], str]]:
         """!
         @brief Get all custom speech rules from loaded plugins.
         
+        @details
+        The merged rules are computed once per change to the loaded set;
+        each call returns a fresh copy.
+        
         @return Combined dictionary of speech rules
         """
-        rules = {}
-        for plugin in self.get_plugins_by_type(PluginType.SPEECH_RULES):
-            if isinstance(plugin, SpeechRulesPlugin):
-                rules.update(plugin.get_speech_rules())
-        return rules
+        rules = self._speech_rules
+        if rules is None:
+            rules = {}
+            for plugin in self.get_plugins_by_type(PluginType.SPEECH_RULES):
+                if isinstance(plugin, SpeechRulesPlugin):
+                    rules.update(plugin.get_speech_rules())
+            self._speech_rules = rules
+        return dict(rules)
     
     def get_braille_notations(self) -> dict[str, BrailleNotationPlugin]:
         """!
         @brief Get all custom Braille notations from plugins.
         
+        @details
+        Cached like get_speech_rules().
+        
         @return Dictionary of notation_name -> plugin
         """
-        notations = {}
-        for plugin in self.get_plugins_by_type(PluginType.BRAILLE_NOTATION):
-            if isinstance(plugin, BrailleNotationPlugin):
-                notations[plugin.notation_name] = plugin
-        return notations
+        notations = self._braille_notations
+        if notations is None:
+            notations = {}
+            for plugin in self.get_plugins_by_type(PluginType.BRAILLE_NOTATION):
+                if isinstance(plugin, BrailleNotationPlugin):
+                    notations[plugin.notation_name] = plugin
+            self._braille_notations = notations
+        return dict(notations)
+    
+    def _invalidate_lookups(self) -> None:
+        """Drop the per-type groups and merged lookups after the loaded set changes."""
+        self._plugins_by_type = None
+        self._speech_rules = None
+        self._braille_notations = None
     
     def unload_all(self) -> None:
         """!
@@ -396,4 +563,6 @@ class PluginManager:
                 logger.error(f"Error cleaning up plugin {plugin.info.name}: {e}")
         
         self._plugins.clear()
+        self._loaded_modules.clear()
+        self._invalidate_lookups()
         logger.info("All plugins unloaded")
@@ -12,15 +12,37 @@ generation, and Braille conversion into a simple, unified interface.
 
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Optional
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, TextIO
 
 from accessible_math_reader.config import Config
 from accessible_math_reader.core.parser import MathParser
 from accessible_math_reader.core.semantic import SemanticNode, MathNavigator
 from accessible_math_reader.core.renderer import MathRenderer
-from accessible_math_reader.speech.engine import SpeechEngine
-from accessible_math_reader.speech.rules import VerbosityLevel
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    
+    from accessible_math_reader.speech.engine import SpeechEngine
+    from accessible_math_reader.speech.rules import VerbosityLevel
+
+
+# Per-process reader used by to_braille_batch() workers
+_batch_reader: Optional[MathReader] = None
+_batch_notation = "nemeth"
+
+
+def _init_batch_worker(config: Config, notation: str) -> None:
+    """Build the reader each batch worker process renders with."""
+    global _batch_reader, _batch_notation
+    _batch_reader = MathReader(config)
+    _batch_notation = notation
+
+
+def _braille_batch_item(math_input: str) -> str:
+    """Render one expression inside a batch worker process."""
+    return _batch_reader.to_braille(math_input, notation=_batch_notation)
 
 
 class MathReader:
@@ -66,6 +88,22 @@ class MathReader:
     @endcode
     """
     
+    # Maximum number of rendered outputs cached per output kind
+    CACHE_SIZE = 4096
+    
+    # Maximum number of parsed trees shared between output kinds
+    PARSE_CACHE_SIZE = 128
+    
+    # Expressions handed to a batch worker per round trip, and the least
+    # work a worker process is started for: a chunk takes ~30ms to render
+    # (~110us per expression), several times a forked worker's start-up
+    BATCH_CHUNKSIZE = 256
+    
+    # Smallest batch sent to a process pool. Two forked workers cost
+    # ~10-30ms to start, which in-process rendering only exceeds from
+    # about 500 expressions, so smaller batches stay in-process
+    BATCH_POOL_THRESHOLD = 512
+    
     def __init__(self, config: Optional[Config] = None) -> None:
         """!
         @brief Initialize the MathReader.
@@ -75,7 +113,19 @@ class MathReader:
         self.config = config or Config()
         self._parser = MathParser()
         self._renderer = MathRenderer(self.config)
-        self._speech_engine = SpeechEngine(self.config)
+        
+        # Created on first audio or SSML request; speech text and Braille
+        # never touch the TTS layer
+        self._speech_engine: Optional[SpeechEngine] = None
+        
+        # Per-instance LRU caches of rendered output keyed by source string,
+        # so repeated expressions skip the parse and render pipeline
+        self._cached_speech = lru_cache(maxsize=self.CACHE_SIZE)(self._render_speech)
+        self._cached_braille = lru_cache(maxsize=self.CACHE_SIZE)(self._render_braille)
+        
+        # Trees are read-only to the renderers, so speech and both Braille
+        # notations of one input share a single parse
+        self._cached_parse = lru_cache(maxsize=self.PARSE_CACHE_SIZE)(self._parser.parse)
     
     def parse(self, math_input: str) -> SemanticNode:
         """!
@@ -102,7 +152,11 @@ class MathReader:
         @param math_input LaTeX or MathML string
         @return Spoken text representation
         """
-        tree = self.parse(math_input)
+        return self._cached_speech(math_input)
+    
+    def _render_speech(self, math_input: str) -> str:
+        """Parse and render speech text (uncached)."""
+        tree = self._cached_parse(math_input)
         return self._renderer.to_speech(tree)
     
     def to_braille(
@@ -117,7 +171,51 @@ class MathReader:
         @param notation Braille notation: "nemeth" or "ueb"
         @return Braille string
         """
-        tree = self.parse(math_input)
+        return self._cached_braille(math_input, notation)
+    
+    def to_braille_batch(
+        self,
+        math_inputs: list[str],
+        notation: str = "nemeth",
+        max_workers: Optional[int] = None,
+    ) -> list[str]:
+        """!
+        @brief Convert many expressions to Braille across worker processes.
+        
+        @details
+        Each expression renders independently, so large documents are
+        split into chunks and mapped over a process pool, side-stepping
+        the GIL. Every worker builds its own reader from this reader's
+        configuration. No more workers are started than there are
+        chunks, and batches smaller than BATCH_POOL_THRESHOLD, or runs
+        with one worker, are rendered in-process, where they finish
+        before a pool would have started.
+        
+        @param math_inputs LaTeX or MathML strings
+        @param notation Braille notation: "nemeth" or "ueb"
+        @param max_workers Worker process count (defaults to CPU count)
+        @return Braille strings in input order
+        """
+        count = len(math_inputs)
+        chunks = -(-count // self.BATCH_CHUNKSIZE)
+        workers = min(max_workers or os.cpu_count() or 1, chunks)
+        if workers <= 1 or count < self.BATCH_POOL_THRESHOLD:
+            return [self.to_braille(m, notation) for m in math_inputs]
+        
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(self.config, notation),
+        ) as executor:
+            return list(executor.map(
+                _braille_batch_item, math_inputs, chunksize=self.BATCH_CHUNKSIZE
+            ))
+    
+    def _render_braille(self, math_input: str, notation: str) -> str:
+        """Parse and render Braille (uncached)."""
+        tree = self._cached_parse(math_input)
         return self._renderer.to_braille(tree, notation=notation)
     
     def to_audio(
@@ -133,7 +231,7 @@ class MathReader:
         @return Path to generated audio file
         """
         speech_text = self.to_speech(math_input)
-        return self._speech_engine.synthesize(speech_text, output_path)
+        return self._get_speech_engine().synthesize(speech_text, output_path)
     
     def to_ssml(self, math_input: str) -> str:
         """!
@@ -147,7 +245,14 @@ class MathReader:
         @return SSML string
         """
         speech_text = self.to_speech(math_input)
-        return self._speech_engine.to_math_ssml(speech_text)
+        return self._get_speech_engine().to_math_ssml(speech_text)
+    
+    def _get_speech_engine(self) -> SpeechEngine:
+        """Return the speech engine, creating it on first use."""
+        if self._speech_engine is None:
+            from accessible_math_reader.speech.engine import SpeechEngine
+            self._speech_engine = SpeechEngine(self.config)
+        return self._speech_engine
     
     def get_navigator(self, math_input: str) -> MathNavigator:
         """!
@@ -169,13 +274,29 @@ class MathReader:
         
         @details
         Returns a dictionary representation of the semantic tree,
-        useful for debugging or building custom renderers.
+        useful for debugging or building custom renderers. Each call
+        parses the input afresh, so every structure gets its own node IDs
+        (they become DOM ids, which must be unique within a page).
         
         @param math_input LaTeX or MathML string
         @return Dictionary representation of the expression
         """
-        tree = self.parse(math_input)
-        return tree.to_dict()
+        return self.parse(math_input).to_dict()
+    
+    def export_structure(self, math_input: str, fp: TextIO) -> None:
+        """!
+        @brief Write the structural representation of an expression as JSON.
+        
+        @details
+        Streams the same JSON document that json.dump() would produce
+        for get_structure(), without materializing the dictionary tree.
+        Like get_structure(), each call uses a fresh parse and fresh
+        node IDs.
+        
+        @param math_input LaTeX or MathML string
+        @param fp Writable text stream
+        """
+        self.parse(math_input).write_json(fp)
     
     def set_verbosity(self, level: str | VerbosityLevel) -> None:
         """!
@@ -184,10 +305,26 @@ class MathReader:
         @param level Verbosity: "verbose", "concise", or "superbrief"
         """
         if isinstance(level, str):
+            from accessible_math_reader.speech.rules import VerbosityLevel
             level = VerbosityLevel(level)
         
         from accessible_math_reader.config import SpeechStyle
         self.config.speech.style = SpeechStyle(level.value)
         
-        # Recreate renderer with new config
+        # Recreate renderer with new config and drop stale speech output
         self._renderer = MathRenderer(self.config)
+        self._cached_speech.cache_clear()
+    
+    def clear_cache(self) -> None:
+        """!
+        @brief Discard all cached parse trees and rendered output.
+        
+        @details
+        Useful for long-running readers that have seen many one-off
+        expressions. parse() and get_navigator() always build fresh
+        trees, since their callers may modify them, so they are not
+        affected by this cache.
+        """
+        self._cached_parse.cache_clear()
+        self._cached_speech.cache_clear()
+        self._cached_braille.cache_clear()
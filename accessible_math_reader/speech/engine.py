@@ -12,7 +12,9 @@ backend and support for SSML generation.
 
 from __future__ import annotations
 
+import io
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
@@ -60,6 +62,9 @@ class GTTSBackend(TTSBackend):
     internet connection. Does not support SSML.
     """
     
+    # Maximum number of synthesized clips kept in memory
+    CACHE_SIZE = 64
+    
     def __init__(self, language: str = "en") -> None:
         """!
         @brief Initialize gTTS backend.
@@ -67,6 +72,11 @@ class GTTSBackend(TTSBackend):
         @param language Language code (e.g., "en", "en-US")
         """
         self.language = language
+        
+        # Per-instance LRU cache of MP3 bytes keyed by (text, language), so
+        # repeated expressions are written from memory instead of
+        # re-requesting the same audio from the network
+        self._cached_audio = lru_cache(maxsize=self.CACHE_SIZE)(self._fetch_audio)
     
     def synthesize(self, text: str, output_path: Path) -> Path:
         """!
@@ -77,18 +87,32 @@ class GTTSBackend(TTSBackend):
         @return Path to generated audio
         @throws ImportError If gTTS is not installed
         """
+        audio = self._cached_audio(text, self.language)
+        
+        # SpeechEngine already passes a Path; re-parsing one costs more
+        # than the isinstance check
+        if not isinstance(output_path, Path):
+            output_path = Path(output_path)
+        
+        # Usually the directory exists, so only create it on failure
+        try:
+            output_path.write_bytes(audio)
+        except FileNotFoundError:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(audio)
+        
+        return output_path
+    
+    def _fetch_audio(self, text: str, language: str) -> bytes:
+        """Request MP3 audio for text from gTTS (uncached)."""
         try:
             from gtts import gTTS
         except ImportError:
             raise ImportError("gTTS is required. Install with: pip install gtts")
         
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        tts = gTTS(text=text, lang=self.language)
-        tts.save(str(output_path))
-        
-        return output_path
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=language).write_to_fp(buffer)
+        return buffer.getvalue()
     
     @property
     def supports_ssml(self) -> bool:
@@ -154,9 +178,36 @@ class SpeechEngine:
         @param output_path Output file path
         @return Path to generated audio
         """
-        output_path = Path(output_path)
+        if not isinstance(output_path, Path):
+            output_path = Path(output_path)
         return self._backend.synthesize(text, output_path)
     
+    def synthesize_many(
+        self,
+        items: list[tuple[str, str | Path]],
+        max_workers: int = 8,
+    ) -> list[Path]:
+        """!
+        @brief Synthesize several texts to audio files concurrently.
+        
+        @details
+        Synthesis is dominated by waiting on the TTS service, so the
+        requests are issued from a thread pool and overlap their round
+        trips instead of running back to back. The backend must be
+        safe to call from several threads; GTTSBackend is.
+        
+        @param items (text, output path) pairs
+        @param max_workers Maximum number of requests in flight
+        @return Paths to the generated audio, in input order
+        """
+        if max_workers <= 1 or len(items) <= 1:
+            return [self.synthesize(text, path) for text, path in items]
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(lambda item: self.synthesize(*item), items))
+    
     def to_ssml(
         self, 
         text: str,
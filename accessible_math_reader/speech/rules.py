@@ -17,7 +17,9 @@ from enum import Enum
 from typing import TYPE_CHECKING, Callable, Optional
 
 from accessible_math_reader.core.semantic import SemanticNode, NodeType
-from accessible_math_reader.core.renderer import BaseRenderer
+from accessible_math_reader.core.renderer import (
+    BaseRenderer, ALL_CHILDREN, compile_layouts, render_layout,
+)
 
 if TYPE_CHECKING:
     from accessible_math_reader.config import Config
@@ -160,6 +162,22 @@ class SpeechRuleSet:
         "∞": "infinity",
     }
     
+    def __init__(self) -> None:
+        """!
+        @brief Initialize the rule set.
+        
+        @details
+        Resolves every phrase for every verbosity level once, including
+        the fallback to the verbose phrase, into a table keyed by
+        (key, verbosity), so get_phrase() is a single dict lookup.
+        """
+        verbose = VerbosityLevel.VERBOSE
+        self._phrases: dict[tuple[str, VerbosityLevel], str] = {
+            (key, level): phrases.get(level, phrases.get(verbose, ""))
+            for key, phrases in self.PHRASES.items()
+            for level in VerbosityLevel
+        }
+    
     def get_phrase(self, key: str, verbosity: VerbosityLevel) -> str:
         """!
         @brief Get a phrase for a given key and verbosity level.
@@ -168,8 +186,7 @@ class SpeechRuleSet:
         @param verbosity Verbosity level
         @return The phrase, or empty string if not found
         """
-        phrases = self.PHRASES.get(key, {})
-        return phrases.get(verbosity, phrases.get(VerbosityLevel.VERBOSE, ""))
+        return self._phrases.get((key, verbosity), "")
     
     def get_operator_name(self, operator: str) -> str:
         """!
@@ -230,6 +247,57 @@ class SpeechRenderer(BaseRenderer):
         super().__init__(config)
         self.rules = SpeechRuleSet()
         self._verbosity = self._get_verbosity()
+        
+        # The verbosity is fixed for the renderer's lifetime, so every
+        # phrase is resolved once here rather than once per node
+        self._phrases = {
+            key: self.rules.get_phrase(key, self._verbosity)
+            for key in self.rules.PHRASES
+        }
+        
+        # Bound lookups of the symbol name tables for the leaf renderers,
+        # saving the self.rules attribute chain and method call per leaf
+        self._number_name = self.rules.NUMBER_NAMES.get
+        self._identifier_name = self.rules.IDENTIFIER_NAMES.get
+        self._operator_name = self.rules.OPERATOR_NAMES.get
+        self._relation_name = self.rules.RELATION_NAMES.get
+        
+        # Composite node layouts for render_layout(): phrases, child
+        # indices (skipped when the child is missing) and ALL_CHILDREN.
+        # Phrases that are empty at this verbosity are left out.
+        phrases = self._phrases
+        layouts = {
+            NodeType.ROOT: (ALL_CHILDREN,),
+            NodeType.GROUP: (ALL_CHILDREN,),
+            # "start fraction [num] over [denom] end fraction"
+            NodeType.FRACTION: (
+                phrases["fraction_start"], 0, phrases["fraction_over"], 1,
+                phrases["fraction_end"],
+            ),
+            # "[base] to the power of [exp]"
+            NodeType.SUPERSCRIPT: (0, phrases["superscript"], 1),
+            # "[base] subscript [sub]"
+            NodeType.SUBSCRIPT: (0, phrases["subscript"], 1),
+            # "square root of [radicand] end root"
+            NodeType.SQRT: (phrases["sqrt"], 0, phrases["sqrt_end"]),
+            # "[index] root of [radicand]"
+            NodeType.NROOT: (0, phrases["nroot"], 1),
+            NodeType.SUM: (phrases["sum"], ALL_CHILDREN),
+            NodeType.INTEGRAL: (phrases["integral"], ALL_CHILDREN),
+        }
+        self._layouts = compile_layouts({
+            node_type: tuple(part for part in layout if part != "")
+            for node_type, layout in layouts.items()
+        })
+        
+        # Leaf render methods by node type, resolved once instead of per
+        # node. A subclass that defines _render_<type> for a composite
+        # type replaces its layout.
+        self._dispatch = {
+            node_type: method
+            for node_type in NodeType
+            if (method := getattr(self, f"_render_{node_type.name.lower()}", None))
+        }
     
     def _get_verbosity(self) -> VerbosityLevel:
         """Get verbosity level from config."""
@@ -240,153 +308,42 @@ class SpeechRenderer(BaseRenderer):
         """!
         @brief Render a semantic node to speech text.
         
+        @details
+        The tree is walked iteratively with render_layout(), so deep
+        expressions do not recurse; the non-empty phrases and leaf words
+        are joined with single spaces.
+        
         @param node The node to render
         @return Spoken text representation
         """
-        method = getattr(self, f"_render_{node.node_type.name.lower()}", None)
-        if method:
-            return method(node)
-        return self._render_default(node)
-    
-    def _render_root(self, node: SemanticNode) -> str:
-        """Render root node."""
-        return self._join_parts(self.render(c) for c in node.children)
-    
-    def _render_group(self, node: SemanticNode) -> str:
-        """Render group node."""
-        return self._join_parts(self.render(c) for c in node.children)
+        return render_layout(
+            node, self._layouts, self._dispatch, self._render_default, " "
+        )
     
     def _render_number(self, node: SemanticNode) -> str:
         """Render number."""
-        return self.rules.NUMBER_NAMES.get(node.content, node.content)
+        content = node.content
+        return self._number_name(content, content)
     
     def _render_identifier(self, node: SemanticNode) -> str:
         """Render identifier."""
-        return self.rules.get_identifier_name(node.content)
+        content = node.content
+        return self._identifier_name(content, content)
     
     def _render_operator(self, node: SemanticNode) -> str:
         """Render operator."""
-        return self.rules.get_operator_name(node.content)
+        content = node.content
+        return self._operator_name(content, content)
     
     def _render_relation(self, node: SemanticNode) -> str:
         """Render relation."""
-        return self.rules.get_relation_name(node.content)
+        content = node.content
+        return self._relation_name(content, content)
     
     def _render_function(self, node: SemanticNode) -> str:
         """Render function name."""
         return node.content
     
-    def _render_fraction(self, node: SemanticNode) -> str:
-        """!
-        @brief Render fraction.
-        
-        @details
-        Verbose: "start fraction [num] over [denom] end fraction"
-        Concise: "[num] over [denom]"
-        """
-        parts = []
-        
-        start = self.rules.get_phrase("fraction_start", self._verbosity)
-        if start:
-            parts.append(start)
-        
-        if node.children:
-            parts.append(self.render(node.children[0]))
-        
-        parts.append(self.rules.get_phrase("fraction_over", self._verbosity))
-        
-        if len(node.children) > 1:
-            parts.append(self.render(node.children[1]))
-        
-        end = self.rules.get_phrase("fraction_end", self._verbosity)
-        if end:
-            parts.append(end)
-        
-        return self._join_parts(parts)
-    
-    def _render_superscript(self, node: SemanticNode) -> str:
-        """!
-        @brief Render superscript/exponent.
-        
-        @details
-        Verbose: "[base] to the power of [exp]"
-        """
-        parts = []
-        
-        if node.children:
-            parts.append(self.render(node.children[0]))
-        
-        parts.append(self.rules.get_phrase("superscript", self._verbosity))
-        
-        if len(node.children) > 1:
-            parts.append(self.render(node.children[1]))
-        
-        return self._join_parts(parts)
-    
-    def _render_subscript(self, node: SemanticNode) -> str:
-        """!
-        @brief Render subscript.
-        
-        @details
-        Verbose: "[base] subscript [sub]"
-        """
-        parts = []
-        
-        if node.children:
-            parts.append(self.render(node.children[0]))
-        
-        parts.append(self.rules.get_phrase("subscript", self._verbosity))
-        
-        if len(node.children) > 1:
-            parts.append(self.render(node.children[1]))
-        
-        return self._join_parts(parts)
-    
-    def _render_sqrt(self, node: SemanticNode) -> str:
-        """!
-        @brief Render square root.
-        """
-        parts = [self.rules.get_phrase("sqrt", self._verbosity)]
-        
-        if node.children:
-            parts.append(self.render(node.children[0]))
-        
-        end = self.rules.get_phrase("sqrt_end", self._verbosity)
-        if end:
-            parts.append(end)
-        
-        return self._join_parts(parts)
-    
-    def _render_nroot(self, node: SemanticNode) -> str:
-        """!
-        @brief Render n-th root.
-        """
-        parts = []
-        
-        # Index comes first
-        if len(node.children) > 0:
-            parts.append(self.render(node.children[0]))
-        
-        parts.append(self.rules.get_phrase("nroot", self._verbosity))
-        
-        # Radicand
-        if len(node.children) > 1:
-            parts.append(self.render(node.children[1]))
-        
-        return self._join_parts(parts)
-    
-    def _render_sum(self, node: SemanticNode) -> str:
-        """Render summation."""
-        parts = [self.rules.get_phrase("sum", self._verbosity)]
-        parts.extend(self.render(c) for c in node.children)
-        return self._join_parts(parts)
-    
-    def _render_integral(self, node: SemanticNode) -> str:
-        """Render integral."""
-        parts = [self.rules.get_phrase("integral", self._verbosity)]
-        parts.extend(self.render(c) for c in node.children)
-        return self._join_parts(parts)
-    
     def _render_text(self, node: SemanticNode) -> str:
         """Render text content."""
         return node.content
@@ -395,8 +352,4 @@ class SpeechRenderer(BaseRenderer):
         """Default rendering for unknown node types."""
         if node.content:
             return node.content
-        return self._join_parts(self.render(c) for c in node.children)
-    
-    def _join_parts(self, parts) -> str:
-        """Join parts, filtering empty strings."""
-        return " ".join(p for p in parts if p)
+        return " ".join(filter(None, map(self.render, node.children)))
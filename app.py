@@ -1,8 +1,9 @@
 from flask import Flask, render_template, request, send_from_directory
 # 1. Import BOTH parser functions
 from src.latex_parser import parse_math_input, latex_to_braille_simple
-from src.speech_converter import text_to_speech
+from src.speech_converter import AUDIO_DIR, text_to_speech_async, wait_for_audio
 from src.braille_converter import math_to_braille
+from functools import lru_cache
 import os
 
 app = Flask(__name__)
@@ -17,12 +18,14 @@ def index():
     # This ensures the placeholder shows
     return render_template('index.html', input_text=None, readable_text=None)
 
-@app.route('/convert', methods=['POST'])
-def convert():
-    math_input = request.form.get('math_input', '')
-    
-    # --- This is the new logic ---
-    
+@lru_cache(maxsize=512)
+def _convert(math_input):
+    """
+    Run the text pipeline for one input and return
+    (readable_text, braille_text).
+    Both steps are deterministic, so repeated submissions of the same
+    input are answered from this cache.
+    """
     # 1. Generate readable text for SPEECH
     # (e.g., "\frac{a}{b}" -> "a divided by b")
     readable_text = parse_math_input(math_input)
@@ -34,14 +37,22 @@ def convert():
     # 3. Generate Braille text from the SIMPLE string
     # (e.g., "a/b" -> "⠁⠌⠃")
     braille_text = math_to_braille(simple_math_text)
-    
+
+    return readable_text, braille_text
+
+@app.route('/convert', methods=['POST'])
+def convert():
+    math_input = request.form.get('math_input', '')
+    readable_text, braille_text = _convert(math_input)
+
     # 4. Generate Speech from the READABLE string
-    # (e.g., "a divided by b" -> output.mp3)
-    audio_path = text_to_speech(readable_text)
+    # (e.g., "a divided by b" -> tts_<hash>.mp3). Synthesis runs in the
+    # background; /audio/<file> waits for it when the browser asks.
+    # Not cached with the text: the MP3 may have failed or been removed
+    # since, and checking for it is only a hash and a stat
+    audio_path = text_to_speech_async(readable_text)
     audio_file = os.path.basename(audio_path)
 
-    # --- End of new logic ---
-
     return render_template(
         'index.html',
         input_text=math_input,
@@ -52,8 +63,11 @@ def convert():
 
 @app.route('/audio/<path:filename>')
 def serve_audio(filename):
+    # The file may still be in synthesis from /convert
+    wait_for_audio(os.path.join(AUDIO_DIR, filename))
     # Ensure the path is correct
     return send_from_directory(os.path.join(app.root_path, 'static/audio'), filename)
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    # Debug mode (reloader, template auto-reload) is opt-in via FLASK_DEBUG=1
+    app.run()
\ No newline at end of file
@@ -15,9 +15,19 @@ BRAILLE_MAP = {
     '(': '⠣', ')': '⠜', '<': '⠪', '>': '⠻', ' ': ' '
 }
 
+# Dense translation table for str.translate, indexed by code point. Every
+# key of BRAILLE_MAP is ASCII, so 128 entries cover it; unmapped ASCII maps
+# to itself and anything past the end raises IndexError, which translate
+# treats as "leave unchanged", without the KeyError a dict raises per miss.
+# Uppercase letters map to their lowercase cells, so ASCII input needs no
+# separate lower() pass
+_BRAILLE_TABLE = tuple(
+    BRAILLE_MAP.get(chr(i).lower(), chr(i).lower()) for i in range(128)
+)
+
 def math_to_braille(text: str) -> str:
     """Convert basic math text to Braille symbols."""
-    result = ""
-    for char in text.lower():
-        result += BRAILLE_MAP.get(char, char)
-    return result
+    if not text.isascii():
+        # Non-ASCII case folding can change other characters too
+        text = text.lower()
+    return text.translate(_BRAILLE_TABLE)
@@ -1,48 +1,142 @@
 import re
-import xml.etree.ElementTree as ET
+from functools import lru_cache
 
+try:
+    # libxml2 parses MathML in C; the element API used below is the same.
+    # Named ET after the xml.etree.ElementTree fallback it stands in for
+    from lxml import etree as ET  # noqa: N812
+
+    # Before lxml 5 entities are either all resolved (external files
+    # included) or left as entity nodes the walk cannot read, so older
+    # versions use the stdlib parser, which expands internal ones only
+    if ET.LXML_VERSION < (5,):
+        raise ImportError("lxml 5 or later is needed for MathML parsing")
+
+    # Match the stdlib parser: drop comments and processing instructions,
+    # expand internal entities only, never touch the network and lift
+    # libxml2's 256-level nesting limit (huge_tree)
+    _XML_PARSER = ET.XMLParser(
+        remove_comments=True, remove_pis=True, no_network=True, huge_tree=True,
+        resolve_entities="internal",
+    )
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    _XML_PARSER = None
+
+# Results kept per function; every converter here is a pure str -> str
+# mapping, so repeated /convert submissions skip the whole pipeline
+CACHE_SIZE = 1024
+
+# Spoken templates for parse_mathml(), keyed by tag: the number of children
+# the template needs and the template itself. Any other child count falls
+# back to reading the children in order
+_MATHML_TEMPLATES = {
+    "mfrac": (2, "{} divided by {}"),
+    "msup": (2, "{} to the power of {}"),
+    "msub": (2, "{} sub {}"),
+    "msqrt": (1, "square root of {}"),
+}
+
+# Spoken names for <mo> operators; anything else is read as written
+_MATHML_OPERATORS = {"+": "plus", "-": "minus", "=": "equals", "*": "times", "(": "", ")": ""}
+
+@lru_cache(maxsize=CACHE_SIZE)
 def parse_mathml(mathml_str):
     """
     Parse MathML input and convert it into a readable English string.
     Example: <math><mfrac><mi>a</mi><mi>b</mi></mfrac></math> -> 'a divided by b'
     """
     try:
-        root = ET.fromstring(mathml_str)
+        try:
+            root = ET.fromstring(mathml_str, _XML_PARSER)
+        except ValueError:
+            # lxml only accepts an XML declaration on bytes input
+            root = ET.fromstring(mathml_str.encode("utf-8"), _XML_PARSER)
     except ET.ParseError:
         return "Invalid MathML syntax."
 
-    def walk(node):
-        tag = node.tag.split('}')[-1]  # remove namespace if present
-
-        if tag == "math":
-            return " ".join(walk(child) for child in node)
-        elif tag == "mfrac":
-            if len(list(node)) == 2:
-                num, denom = list(node)
-                return f"{walk(num)} divided by {walk(denom)}"
-        elif tag == "msup":
-            if len(list(node)) == 2:
-                base, exp = list(node)
-                return f"{walk(base)} to the power of {walk(exp)}"
-        elif tag == "msub":
-            if len(list(node)) == 2:
-                base, sub = list(node)
-                return f"{walk(base)} sub {walk(sub)}"
-        elif tag == "msqrt":
-            if len(list(node)) == 1:
-                return f"square root of {walk(node[0])}"
-        elif tag == "mi" or tag == "mn":
-            return node.text.strip() if node.text else ""
-        elif tag == "mo":
-            ops = {"+": "plus", "-": "minus", "=": "equals", "*": "times", "(": "", ")": ""}
-            return ops.get(node.text.strip(), node.text.strip())
-        
-        # Fallback for other tags
-        return " ".join(walk(child) for child in node)
+    # Walk the tree with an explicit stack so deep MathML cannot hit the
+    # recursion limit. Each frame holds an element's child iterator, where
+    # its children's results start, and the template that joins them.
+    # Leaves are read in place; an element with children suspends its
+    # parent's frame until all of its own children have been read. The
+    # root sits in a one-child frame whose join returns it unchanged.
+    results = []
+    append = results.append
+    frames = [(iter((root,)), 0, None)]
+    while frames:
+        children, start, template = frames[-1]
+        for node in children:
+            tag = node.tag.split('}')[-1]  # remove namespace if present
+            if tag == "mi" or tag == "mn":
+                text = node.text
+                append(text.strip() if text else "")
+            elif tag == "mo":
+                text = node.text.strip()
+                append(_MATHML_OPERATORS.get(text, text))
+            else:
+                arity, template = _MATHML_TEMPLATES.get(tag, (None, None))
+                if arity != len(node):
+                    template = None  # Read <math> and other tags child by child
+                frames.append((iter(node), len(results), template))
+                break
+        else:
+            frames.pop()
+            parts = results[start:]
+            del results[start:]
+            append(template.format(*parts) if template else " ".join(parts))
+
+    return results[0]
 
-    return walk(root)
 
+# Greek letters and special symbols for parse_latex(). Replaced one key
+# at a time: for these short inputs a str.replace() per key is faster
+# than a single regex alternation with a lookup callback
+_SYMBOL_MAP = {
+    '\\pi': 'pi', '\\alpha': 'alpha', '\\beta': 'beta', '\\gamma': 'gamma',
+    '\\delta': 'delta', '\\epsilon': 'epsilon', '\\theta': 'theta',
+    '\\infty': 'infinity', '\\pm': 'plus or minus', '\\times': 'times',
+    '\\cdot': 'times', '\\div': 'divided by', '\\leq': 'less than or equal to',
+    '\\geq': 'greater than or equal to', '\\neq': 'not equal to',
+}
 
+# Structural replacements for parse_latex(), compiled once at import.
+# Using a list of tuples to control the order of operations. Each pattern
+# can only match where its trigger substring occurs, so a pass is skipped
+# (one substring scan instead of a regex scan) when the trigger is absent.
+# The passes are kept separate rather than merged into one alternation:
+# each one rescans the previous pass's output, and a single scan would
+# read nested and chained scripts differently
+_STRUCTURAL_REPLACEMENTS = [(trigger, re.compile(pattern), repl) for trigger, pattern, repl in [
+    # Exponents: x^{...} or x^y
+    ('^', r'([a-zA-Z0-9]+)\^\{(.+?)\}', r'\1 to the power of (\2)'),
+    ('^', r'([a-zA-Z0-9]+)\^([a-zA-Z0-9]+)', r'\1 to the power of \2'),
+    # Subscripts: H_{...} or H_2
+    ('_', r'([a-zA-Z0-9]+)_\{(.+?)\}', r'\1 sub (\2)'),
+    ('_', r'([a-zA-Z0-9]+)_([a-zA-Z0-9]+)', r'\1 sub \2'),
+    # Fractions
+    ('\\frac', r'\\frac{(.+?)}{(.+?)}', r'(\1) divided by (\2)'),
+    # Square roots
+    ('\\sqrt', r'\\sqrt{(.+?)}', r'square root of (\1)'),
+    # Keywords
+    ('\\sum', r'\\sum', 'summation of'),
+    ('\\int', r'\\int', 'integral of'),
+]]
+
+
+# Clean up of remaining symbols and characters for parse_latex()
+_CLEANUP_MAP = {
+    '{': '(', '}': ')',
+    '+': ' plus ', '-': ' minus ', '=': ' equals ',
+    '*': ' times ', '/': ' divided by ',
+    '<': ' less than ', '>': ' greater than ',
+    '$': '',  # Remove math delimiters
+    '\\': '' # Remove any remaining backslashes
+}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
 def parse_latex(latex_str):
     """
     Parse basic LaTeX input and convert it into a readable English string.
@@ -51,57 +145,50 @@ def parse_latex(latex_str):
     text = latex_str.strip()
 
     # 1. Handle Greek letters and special symbols first
-    symbol_map = {
-        '\\pi': 'pi', '\\alpha': 'alpha', '\\beta': 'beta', '\\gamma': 'gamma',
-        '\\delta': 'delta', '\\epsilon': 'epsilon', '\\theta': 'theta',
-        '\\infty': 'infinity', '\\pm': 'plus or minus', '\\times': 'times',
-        '\\cdot': 'times', '\\div': 'divided by', '\\leq': 'less than or equal to',
-        '\\geq': 'greater than or equal to', '\\neq': 'not equal to',
-    }
-    for key, value in symbol_map.items():
+    for key, value in _SYMBOL_MAP.items():
         text = text.replace(key, value)
 
     # 2. Use regex for structural replacements (order is important)
-    # Using a list of tuples to control the order of operations
-    structural_replacements = [
-        # Exponents: x^{...} or x^y
-        (r'([a-zA-Z0-9]+)\^\{(.+?)\}', r'\1 to the power of (\2)'),
-        (r'([a-zA-Z0-9]+)\^([a-zA-Z0-9]+)', r'\1 to the power of \2'),
-        # Subscripts: H_{...} or H_2
-        (r'([a-zA-Z0-9]+)_\{(.+?)\}', r'\1 sub (\2)'),
-        (r'([a-zA-Z0-9]+)_([a-zA-Z0-9]+)', r'\1 sub \2'),
-        # Fractions
-        (r'\\frac{(.+?)}{(.+?)}', r'(\1) divided by (\2)'),
-        # Square roots
-        (r'\\sqrt{(.+?)}', r'square root of (\1)'),
-        # Keywords
-        (r'\\sum', 'summation of'),
-        (r'\\int', 'integral of'),
-    ]
-    # Iteratively apply replacements
-    for pattern, repl in structural_replacements:
-        text = re.sub(pattern, repl, text)
+    for trigger, pattern, repl in _STRUCTURAL_REPLACEMENTS:
+        if trigger in text:
+            text = pattern.sub(repl, text)
     # Re-run for nested cases (e.g., \frac{a^2}{b})
-    for pattern, repl in structural_replacements:
-        text = re.sub(pattern, repl, text)
+    for trigger, pattern, repl in _STRUCTURAL_REPLACEMENTS:
+        if trigger in text:
+            text = pattern.sub(repl, text)
 
     # 3. Clean up remaining symbols and characters
-    cleanup_map = {
-        '{': '(', '}': ')',
-        '+': ' plus ', '-': ' minus ', '=': ' equals ',
-        '*': ' times ', '/': ' divided by ',
-        '<': ' less than ', '>': ' greater than ',
-        '$': '',  # Remove math delimiters
-        '\\': '' # Remove any remaining backslashes
-    }
-    for key, value in cleanup_map.items():
+    for key, value in _CLEANUP_MAP.items():
         text = text.replace(key, value)
 
     # 4. Normalize whitespace to a single space
     return ' '.join(text.split())
 
 
+# Simple replacements that map to BRAILLE_MAP, compiled once at import.
+# As in parse_latex(), a pass only runs when its trigger substring occurs
+_BRAILLE_REPLACEMENTS = [(trigger, re.compile(pattern), repl) for trigger, pattern, repl in [
+    # Fractions
+    ('\\frac', r'\\frac{(.+?)}{(.+?)}', r'(\1)/(\2)'),
+    # Exponents: a^2 -> a2, a^{10} -> a10
+    ('^', r'([a-zA-Z0-9]+)\^\{?(.+?)\}?', r'\1\2'),
+    # Subscripts: b_i -> bi, b_{10} -> b10
+    ('_', r'([a-zA-Z0-9]+)_\{?(.+?)\}?', r'\1\2'),
+    # Symbols
+    ('\\pm', r'\\pm', '+'), # Simplified from +-
+    ('\\times', r'\\times', '*'),
+    ('\\cdot', r'\\cdot', '*'),
+    ('\\div', r'\\div', '/'),
+]]
+
+# Symbols not in the braille map and whitespace, removed in one pass.
+# Dropping every backslash also leaves the letters of \sqrt behind, as
+# there is no good braille map for 'sqrt'
+_BRAILLE_STRIP = str.maketrans('', '', '$\\{} ')
+
+
 # --- NEW FUNCTION ---
+@lru_cache(maxsize=CACHE_SIZE)
 def latex_to_braille_simple(latex_str):
     """
     Convert LaTeX to a simple char string that braille_converter.py can understand.
@@ -116,31 +203,15 @@ def latex_to_braille_simple(latex_str):
         
     text = latex_str.strip()
     
-    # Simple replacements that map to BRAILLE_MAP
-    replacements = [
-        # Fractions
-        (r'\\frac{(.+?)}{(.+?)}', r'(\1)/(\2)'),
-        # Exponents: a^2 -> a2, a^{10} -> a10
-        (r'([a-zA-Z0-9]+)\^\{?(.+?)\}?', r'\1\2'),
-        # Subscripts: b_i -> bi, b_{10} -> b10
-        (r'([a-zA-Z0-9]+)_\{?(.+?)\}?', r'\1\2'),
-        # Symbols
-        (r'\\pm', '+'), # Simplified from +-
-        (r'\\times', '*'),
-        (r'\\cdot', '*'),
-        (r'\\div', '/'),
-        # Remove symbols not in braille map
-        (r'[$]', ''), (r'[\\{}]', ''),
-        (r'\\sqrt', ''), # No good braille map for 'sqrt'
-    ]
-    
-    for pattern, repl in replacements:
-        text = re.sub(pattern, repl, text)
+    for trigger, pattern, repl in _BRAILLE_REPLACEMENTS:
+        if trigger in text:
+            text = pattern.sub(repl, text)
     
-    # Remove any remaining whitespace
-    return text.replace(' ', '')
+    # Remove unmapped symbols and any remaining whitespace
+    return text.translate(_BRAILLE_STRIP)
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def parse_math_input(math_str):
     """
     Detect whether input is LaTeX or MathML and return readable text for SPEECH.
@@ -1,5 +1,31 @@
+import contextlib
+import hashlib
+import logging
+import os
+import threading
+# Distinct from the builtin TimeoutError before Python 3.11
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
 from gtts import gTTS
 
+logger = logging.getLogger(__name__)
+
+# Directory for content-addressed audio written by text_to_speech()
+AUDIO_DIR = "static/audio"
+
+# Most content-addressed MP3s kept in AUDIO_DIR. Every input gets its own
+# file, so beyond this the least recently used ones (oldest mtime; a cache
+# hit refreshes it) are deleted along with their SSML
+AUDIO_CACHE_LIMIT = 256
+_prune_lock = threading.Lock()
+
+# Background synthesis for text_to_speech_async(). Requests for a file
+# that is still being written are tracked here by its path, so the same
+# text is only sent to Google once and readers can wait for it
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+_pending = {}
+_pending_lock = threading.Lock()
+
 def generate_ssml(text):
     """
     Generate SSML markup to make math speech more expressive.
@@ -13,18 +39,137 @@ def generate_ssml(text):
     """
     return ssml.strip()
 
-def text_to_speech(text, output_path="static/audio/output.mp3"):
+def audio_path_for(text):
+    """
+    Return the content-addressed MP3 path text_to_speech() uses for text.
+    """
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+    return os.path.join(AUDIO_DIR, f"tts_{key}.mp3")
+
+def _is_cached(output_path):
+    """
+    Return whether output_path exists, marking it as recently used.
+    """
+    try:
+        os.utime(output_path)
+    except FileNotFoundError:
+        return False
+    return True
+
+def _prune_audio_cache():
+    """
+    Delete the least recently used MP3s (and their SSML) in AUDIO_DIR
+    beyond AUDIO_CACHE_LIMIT.
+    """
+    with _prune_lock:
+        entries = []
+        with os.scandir(AUDIO_DIR) as it:
+            for entry in it:
+                if entry.name.startswith("tts_") and entry.name.endswith(".mp3"):
+                    with contextlib.suppress(FileNotFoundError):
+                        entries.append((entry.stat().st_mtime, entry.path))
+
+        excess = len(entries) - AUDIO_CACHE_LIMIT
+        if excess <= 0:
+            return
+        entries.sort()
+        for _, path in entries[:excess]:
+            for victim in (path, path[:-len(".mp3")] + ".ssml"):
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(victim)
+
+def text_to_speech(text, output_path=None):
     """
     Convert text (or SSML fallback) into speech using gTTS.
+    Without an explicit output_path the file is named after a hash of the
+    text, so text that was spoken before is served from the saved MP3
+    instead of another request to Google.
     """
+    cached = output_path is None
+    if cached:
+        output_path = audio_path_for(text)
+        if _is_cached(output_path):
+            return output_path
+
     ssml = generate_ssml(text)
 
     # Fallback since gTTS doesn't support SSML directly
     tts = gTTS(text=text, lang="en")
-    tts.save(output_path)
+    if cached:
+        # Publish the MP3 only once it is complete, since its presence
+        # is what marks the text as already synthesized
+        partial_path = f"{output_path}.{os.getpid()}.{threading.get_ident()}.part"
+        try:
+            tts.save(partial_path)
+            os.replace(partial_path, output_path)
+        finally:
+            # Only left behind if saving failed
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(partial_path)
+    else:
+        tts.save(output_path)
 
-    # Optionally, write SSML version for engines that support it
+    # Optionally, write SSML version for engines that support it. Written
+    # after the MP3, so a failed synthesis leaves no orphan behind
     with open(output_path.replace(".mp3", ".ssml"), "w", encoding="utf-8") as f:
         f.write(ssml)
 
+    if cached:
+        _prune_audio_cache()
+
+    return output_path
+
+def text_to_speech_async(text):
+    """
+    Start synthesizing text in the background and return the path the MP3
+    will be written to, without waiting on the network.
+    Use wait_for_audio() before reading the file.
+    """
+    output_path = audio_path_for(text)
+    if _is_cached(output_path):
+        return output_path
+
+    with _pending_lock:
+        if output_path in _pending:
+            return output_path
+        future = _EXECUTOR.submit(text_to_speech, text)
+        _pending[output_path] = future
+
+    # Registered outside the lock: a future that has already finished
+    # runs the callback right here, and the callback takes the lock
+    future.add_done_callback(
+        lambda done: _synthesis_done(output_path, done)
+    )
     return output_path
+
+def _synthesis_done(output_path, future):
+    """
+    Stop tracking a finished background synthesis and log its failure.
+    A later text_to_speech_async() call for the same text then retries.
+    """
+    with _pending_lock:
+        if _pending.get(output_path) is future:
+            del _pending[output_path]
+    error = future.exception()
+    if error is not None:
+        logger.error(
+            "Speech synthesis failed for %s", output_path,
+            exc_info=(type(error), error, error.__traceback__),
+        )
+
+def wait_for_audio(output_path, timeout=30):
+    """
+    Wait for background synthesis of output_path, if any, to finish.
+    Returns True once the file exists, False if synthesis failed or is
+    still running after timeout seconds.
+    """
+    future = _pending.get(output_path)
+    if future is not None:
+        try:
+            future.result(timeout)
+        except FutureTimeoutError:
+            logger.warning("Speech synthesis still running for %s", output_path)
+        except Exception:
+            pass  # Logged by _synthesis_done()
+
+    return os.path.exists(output_path)